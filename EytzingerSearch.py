@@ -0,0 +1,306 @@
+"""
+Eytzinger Search Index
+A static, read-only search structure over a sorted list, laid out for
+cache-friendly lookups.
+
+A sorted array searched by halving touches log2(n) elements scattered
+across the whole array. The Eytzinger layout stores the same keys in
+breadth-first order of the implicit binary search tree: the root first,
+then its two children, then their four children, and so on. The first
+levels of every search then sit next to each other in memory, and each
+step moves from node k to node 2k+1 or 2k+2.
+
+With blocking, each node holds `block` sorted keys instead of one (a
+static B-tree in breadth-first order, children of node k at
+k*(block+1)+1 ... k*(block+1)+block+1). One node fits in a cache line,
+the tree is log_(block+1)(n) levels deep, and in Python each level is a
+single C-level bisect over the node instead of one interpreter step per
+key.
+
+Keys live in a typed `array.array` (8 bytes per key), not in a list of
+boxed Python objects; the sorted position of a key is computed from its
+slot, so no second per-key array is stored. Building needs NumPy.
+
+In CPython this index does NOT beat `bisect_left` on a sorted array: the
+benchmark below measures lookups 2-3x slower at every size up to 10^6
+(e.g. ~3,000 vs ~1,400 ns at 10^6). The cache-friendly layout saves
+memory stalls that cost far less than the interpreter overhead of each
+extra Python-level step, whereas bisect runs its whole loop in C. It is
+faster than the pure-Python `binary_search`, and the layout is the one a
+compiled consumer of `keys` would want.
+
+Usage:
+  python EytzingerSearch.py                   # tests + benchmark up to 10^6
+  python EytzingerSearch.py --max-exponent 8  # benchmark up to 10^8
+"""
+
+import argparse
+import random
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+from BinarySearch import binary_search
+
+
+class EytzingerIndex:
+    """
+    Eytzinger (breadth-first) layout of a sorted list, optionally blocked.
+
+    All results are positions in the ORIGINAL sorted order, so they can be
+    used to index the list the index was built from.
+    """
+
+    def __init__(self, sorted_values, block=1, typecode="q"):
+        """
+        Build the index.
+
+        Args:
+            sorted_values: Keys in ascending order.
+            block: Keys per node; 1 is the classic Eytzinger layout, 8-16
+                   keys fill a 64-128 byte cache line.
+            typecode: `array` typecode for the keys, "q" (int64, default)
+                      or "d" (float64).
+        """
+        if block < 1:
+            raise ValueError(f"block must be at least 1, got {block}")
+
+        self.n = n = len(sorted_values)
+        self.block = block
+        self.nodes = nodes = -(-n // block)  # ceiling division
+
+        # Slots past the last key are padded with the largest value the
+        # typecode can hold; they sit at the end of the in-order sequence,
+        # so they never precede a real key, and their rank is n ("not found").
+        if typecode in "fd":
+            pad = float("inf")
+        else:
+            bits = 8 * array(typecode).itemsize
+            pad = (1 << (bits - 1 if typecode.islower() else bits)) - 1
+
+        self.keys = array(typecode, [pad]) * (nodes * block)
+
+        # Shape of the implicit tree: first node of each level, and powers of
+        # the fanout. Every level is full except the last one, which holds
+        # `self._last_level` nodes from the left.
+        fanout = block + 1
+        self._starts = starts = []
+        level_start, width = 0, 1
+        while level_start < nodes:
+            starts.append(level_start)
+            level_start += width
+            width *= fanout
+        self._height = height = len(starts) - 1
+        self._powers = [fanout ** e for e in range(height + 2)]
+        self._last_level = nodes - starts[-1] if nodes else 0
+
+        if n:
+            self._fill(sorted_values, pad)
+
+    def _fill(self, sorted_values, pad):
+        """
+        Write sorted_values into their slots, one level at a time: the rank
+        of every slot on a level comes from the same formula as _rank,
+        evaluated as NumPy array arithmetic rather than a per-key traversal.
+        """
+        import numpy as np
+
+        keys = np.frombuffer(self.keys, dtype=self.keys.typecode)
+        values = np.asarray(sorted_values, dtype=keys.dtype)
+        block, n = self.block, self.n
+        fanout = block + 1
+        last_level = self._last_level
+        powers = self._powers
+
+        for depth, first in enumerate(self._starts):
+            last = min(first + powers[depth], self.nodes)
+            slots = np.arange(first * block, last * block, dtype=np.int64)
+            node, i = np.divmod(slots, block)
+            e = self._height - depth
+            rank = (node - first) * powers[e + 1] + (i + 1) * (powers[e] - 1) + i
+            q, rem = np.divmod(rank, fanout)
+            rank -= np.where(q >= last_level,
+                             (q - last_level) * block + np.minimum(rem, block), 0)
+            keys[first * block:last * block] = np.where(
+                rank < n, values[np.minimum(rank, n - 1)], pad)
+
+    def _rank(self, slot):
+        """
+        Position in sorted order of the key in `slot` (n or more for padding).
+
+        Node p of level d roots a subtree whose children each hold
+        fanout**(height - d) - 1 keys; in a tree with a full last level
+        that fixes the rank of every slot. The last level is only filled
+        from the left, so the keys of the absent nodes that would precede
+        the slot are subtracted.
+        """
+        block = self.block
+        node, i = divmod(slot, block)
+        depth = bisect_right(self._starts, node) - 1
+        e = self._height - depth
+        powers = self._powers
+        rank = (node - self._starts[depth]) * powers[e + 1] + (i + 1) * (powers[e] - 1) + i
+        # Last-level node j holds ranks j*fanout .. j*fanout + block - 1
+        q, rem = divmod(rank, block + 1)
+        if q >= self._last_level:
+            rank -= (q - self._last_level) * block + min(rem, block)
+        return rank
+
+    def __len__(self):
+        return self.n
+
+    def _search(self, target, right):
+        """
+        Return the slot of the first key >= target (> target when
+        `right`), or -1 if there is none.
+        """
+        keys = self.keys
+        nodes = self.nodes
+        found = -1
+        node = 0
+
+        if self.block == 1:
+            # Classic Eytzinger descent: remember the last node where we went left
+            if right:
+                while node < nodes:
+                    if keys[node] > target:
+                        found = node
+                        node = 2 * node + 1
+                    else:
+                        node = 2 * node + 2
+            else:
+                while node < nodes:
+                    if keys[node] >= target:
+                        found = node
+                        node = 2 * node + 1
+                    else:
+                        node = 2 * node + 2
+        else:
+            block = self.block
+            fanout = block + 1
+            search = bisect_right if right else bisect_left
+            while node < nodes:
+                start = node * block
+                i = search(keys, target, start, start + block) - start
+                if i < block:
+                    found = start + i
+                node = node * fanout + i + 1
+
+        return found
+
+    def _bound(self, target, right):
+        slot = self._search(target, right)
+        return min(self._rank(slot), self.n) if slot >= 0 else self.n
+
+    def lower_bound(self, target):
+        """Position of the first key >= target (len(index) if none)."""
+        return self._bound(target, False)
+
+    def upper_bound(self, target):
+        """Position of the first key > target (len(index) if none)."""
+        return self._bound(target, True)
+
+    def lookup(self, target):
+        """Position of the first occurrence of target, or -1 if missing."""
+        slot = self._search(target, False)
+        if slot >= 0 and self.keys[slot] == target:
+            # Padding equal to the target ranks n or more
+            rank = self._rank(slot)
+            if rank < self.n:
+                return rank
+        return -1
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+def _time_per_query(search, queries):
+    """Average nanoseconds per call of search(query)."""
+    start = time.perf_counter()
+    for query in queries:
+        search(query)
+    return (time.perf_counter() - start) / len(queries) * 1e9
+
+
+def benchmark(sizes, query_count=100_000, blocks=(1, 16), seed=0):
+    """Print ns/lookup for binary_search, bisect and Eytzinger indexes."""
+    rng = random.Random(seed)
+    print(f"{'n':>12}  {'binary_search':>14}  {'bisect':>8}"
+          + "".join(f"  {f'eytz b={b}':>10}" for b in blocks) + "   (ns/lookup)")
+
+    for n in sizes:
+        # Even keys, so half the queries hit and half miss
+        values = range(0, 2 * n, 2)
+        sorted_list = array("q", values)
+        queries = [rng.randrange(2 * n) for _ in range(query_count)]
+
+        row = [
+            _time_per_query(lambda q: binary_search(sorted_list, q), queries),
+            _time_per_query(lambda q: bisect_left(sorted_list, q), queries),
+        ]
+        for block in blocks:
+            index = EytzingerIndex(values, block=block)
+            row.append(_time_per_query(index.lookup, queries))
+            del index
+
+        print(f"{n:>12,}  {row[0]:>14,.0f}  {row[1]:>8,.0f}"
+              + "".join(f"  {t:>10,.0f}" for t in row[2:]))
+
+
+# ---------------------------------------------------------------------------
+# Demo / Tests
+# ---------------------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Eytzinger search index tests and benchmark.")
+    parser.add_argument("--max-exponent", type=int, default=6,
+                        help="Benchmark sizes 10^3 .. 10^N (default 6).")
+    parser.add_argument("--queries", type=int, default=100_000,
+                        help="Lookups timed per size (default 100000).")
+    args = parser.parse_args()
+
+    print("Eytzinger Index Test Results")
+    print("=" * 70)
+
+    rng = random.Random(42)
+    test_cases = [
+        # (label, sorted values)
+        ("Empty",               []),
+        ("Single element",      [5]),
+        ("Small distinct",      [1, 3, 5, 7, 9]),
+        ("Duplicates",          [1, 2, 2, 2, 3, 3, 8]),
+        ("Random with repeats", sorted(rng.randrange(500) for _ in range(1000))),
+        ("Negative numbers",    [-10, -5, 0, 5, 10]),
+    ]
+
+    all_passed = True
+    for label, values in test_cases:
+        queries = range(min(values, default=0) - 2, max(values, default=0) + 3)
+        for block in (1, 2, 4, 16):
+            index = EytzingerIndex(values, block=block)
+            passed = all(
+                index.lower_bound(q) == bisect_left(values, q)
+                and index.upper_bound(q) == bisect_right(values, q)
+                and index.lookup(q) == (bisect_left(values, q)
+                                        if q in values else -1)
+                for q in queries)
+            if not passed:
+                all_passed = False
+            print(f"{'PASS' if passed else 'FAIL'}  {label:22s}  block={block:<3}  n={len(values)}")
+
+    floats = [0.5, 1.25, 1.25, 9.0]
+    index = EytzingerIndex(floats, block=4, typecode="d")
+    passed = (index.lookup(1.25) == 1 and index.lookup(2.0) == -1
+              and index.upper_bound(9.0) == 4)
+    if not passed:
+        all_passed = False
+    print(f"{'PASS' if passed else 'FAIL'}  {'Float keys':22s}  block=4    n={len(floats)}")
+
+    print("=" * 70)
+    print(f"All tests passed: {all_passed}")
+
+    print("\nBenchmark")
+    benchmark([10 ** e for e in range(3, args.max_exponent + 1)], args.queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,20 @@
-def knapsack(weights, values, capacity):
+import heapq
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from math import gcd
+
+INT64_MAX = 2 ** 63 - 1
+
+KNAPSACK_ENGINES = ("python", "numpy")
+
+KNAPSACK_METHODS = ("auto", "dp", "meet_in_the_middle", "branch_and_bound")
+DP_CELL_LIMIT = 10 ** 8        # largest n * capacity the DP is allowed to fill
+NUMPY_DP_CELLS = 10 ** 6       # above this many cells, use the NumPy engine
+MITM_MAX_ITEMS = 40            # 2 * 2^20 subsets is still fast to enumerate
+
+
+def knapsack(weights, values, capacity, engine="python"):
     """
     Solve the 0/1 Knapsack Problem using Dynamic Programming with space optimization.
 
@@ -13,6 +29,9 @@ def knapsack(weights, values, capacity):
         weights: List of item weights (non-negative integers).
         values:  List of item values (non-negative integers).
         capacity: Maximum weight the knapsack can hold (non-negative integer).
+        engine:  "python" (default) for the pure-Python loop below, or
+                 "numpy" for `_knapsack_numpy`, which vectorizes each item's
+                 row update. Both return identical results.
 
     Returns:
         The maximum value achievable within the given capacity.
@@ -20,10 +39,30 @@ def knapsack(weights, values, capacity):
     Time:  O(n * capacity) where n is the number of items
     Space: O(capacity) — only a single 1D array is used
     """
+    if engine not in KNAPSACK_ENGINES:
+        raise ValueError(f"engine must be one of {KNAPSACK_ENGINES}, got {engine!r}")
+
     # Edge case: if no items or no capacity, maximum value is 0
     if not weights or not values or capacity <= 0:
         return 0
 
+    # dp[capacity] holds the maximum value achievable with full capacity
+    best = _knapsack_table(weights, values, capacity, engine)[capacity]
+    # The NumPy engine yields an int64 scalar; the Python list holds the values as given
+    return best.item() if engine == "numpy" else best
+
+
+def _knapsack_table(weights, values, capacity, engine="python"):
+    """
+    Fill the 1D DP array for `knapsack` and return all of it.
+
+    dp[j] is the maximum value achievable with capacity j, for every
+    j <= capacity: a list for the "python" engine, an int64 array for
+    the "numpy" engine.
+    """
+    if engine == "numpy":
+        return _knapsack_numpy(weights, values, capacity)
+
     n = len(weights)
 
     # dp[j] represents the maximum value achievable with capacity j.
@@ -56,10 +95,548 @@ def knapsack(weights, values, capacity):
             if dp[j - weight] + value > dp[j]:
                 dp[j] = dp[j - weight] + value
 
-    # dp[capacity] holds the maximum value achievable with full capacity
+    return dp
+
+
+def _knapsack_numpy(weights, values, capacity):
+    """
+    NumPy engine for `knapsack`: the same 1D DP with vectorized row updates.
+
+    For one item, every new dp[j] depends only on the previous row, so the
+    whole reverse-order inner loop collapses into
+
+        dp[weight:] = max(dp[weight:], dp[:-weight] + value)
+
+    where `dp[:-weight] + value` is materialized as a temporary copy before
+    anything is overwritten, which is exactly what iterating backwards
+    guaranteed in the Python loop.
+
+    Values are stored as int64. Since no packing can exceed sum(values),
+    checking that sum up front rules out overflow during the DP.
+    """
+    import numpy as np
+
+    if sum(values) > INT64_MAX:
+        raise OverflowError("sum of values exceeds int64; use engine='python'")
+
+    dp = np.zeros(capacity + 1, dtype=np.int64)
+
+    for weight, value in zip(weights, values):
+        if weight > capacity:
+            continue
+        if weight == 0:
+            # A weightless item is always worth taking (values are non-negative)
+            dp += value
+            continue
+        np.maximum(dp[weight:], dp[:-weight] + value, out=dp[weight:])
+
+    return dp
+
+
+def knapsack_with_items(weights, values, capacity):
+    """
+    Solve the 0/1 Knapsack Problem and return the chosen items as well.
+
+    Uses the same 1D value array as `knapsack`, plus a bit-packed decision
+    table: for every item, one bit per capacity records whether taking the
+    item improved dp[j]. That is enough to walk back from dp[capacity] and
+    recover the selection, at one bit per cell instead of a boxed Python
+    int per cell in the textbook 2D table (~1/64th the memory).
+
+    Args:
+        weights: List of item weights (non-negative integers).
+        values:  List of item values (non-negative integers).
+        capacity: Maximum weight the knapsack can hold (non-negative integer).
+
+    Returns:
+        (max_value, selected) where `selected` is the ascending list of
+        indices of the items in one optimal packing.
+
+    Time:  O(n * capacity)
+    Space: O(capacity) for values + n * (capacity + 1) bits for decisions
+    """
+    if not weights or not values or capacity <= 0:
+        return 0, []
+
+    n = len(weights)
+    row_bytes = (capacity + 1 + 7) // 8
+
+    dp = [0] * (capacity + 1)
+    # take[i] has bit j set if item i was taken to reach dp[j] after item i
+    take = []
+
+    for i in range(n):
+        weight = weights[i]
+        value = values[i]
+        row = bytearray(row_bytes)
+
+        # Same reverse-order update as `knapsack`; record each improvement
+        for j in range(capacity, weight - 1, -1):
+            if dp[j - weight] + value > dp[j]:
+                dp[j] = dp[j - weight] + value
+                row[j >> 3] |= 1 << (j & 7)
+
+        take.append(row)
+
+    # Backtrack: item i was taken at capacity j iff its bit is set, in which
+    # case the rest of the packing is the optimum for j - weight[i] over
+    # the items before i.
+    selected = []
+    j = capacity
+    for i in range(n - 1, -1, -1):
+        if take[i][j >> 3] >> (j & 7) & 1:
+            selected.append(i)
+            j -= weights[i]
+
+    selected.reverse()
+    return dp[capacity], selected
+
+
+def knapsack_reachable(weights, capacity):
+    """
+    Feasibility (subset-sum) mode: which total weights can be packed exactly?
+
+    This is the 0/1 knapsack special case where every value equals its
+    weight. Instead of a DP array, the set of reachable totals is a single
+    Python big integer whose bit j is set when some subset weighs exactly j.
+    Adding an item shifts the whole set at once:
+
+        reachable |= reachable << weight
+
+    Big-integer shifts and ORs run word-parallel in C, 30-64 capacities per
+    machine operation instead of one per interpreter step.
+
+    Args:
+        weights: List of item weights (non-negative integers).
+        capacity: Maximum total weight (non-negative integer).
+
+    Returns:
+        (best_weight, reachable) where best_weight is the largest reachable
+        total <= capacity (same as knapsack(weights, weights, capacity)) and
+        reachable is the bitset of every reachable total.
+
+    Time:  O(n * capacity / word_size)
+    Space: O(capacity / 8) bytes for the bitset
+    """
+    if capacity < 0:
+        return 0, 0
+
+    # Only totals 0..capacity matter; mask off anything shifted past them
+    mask = (1 << (capacity + 1)) - 1
+    reachable = 1  # the empty subset weighs 0
+
+    for weight in weights:
+        if weight <= capacity:
+            reachable |= (reachable << weight) & mask
+
+    return reachable.bit_length() - 1, reachable
+
+
+def _split_counts(weights, values, counts, capacity):
+    """
+    Binary splitting: turn each item type with `count` copies into 0/1
+    bundles of 1, 2, 4, ..., 2^k copies plus a remainder bundle. Every
+    number of copies from 0 to count is a sum of a subset of the bundles,
+    so a 0/1 knapsack over the bundles equals the bounded knapsack over
+    the copies, with O(log count) bundles per type instead of count items.
+
+    Copies beyond capacity // weight can never all fit, so the count is
+    capped first. Weightless types are always taken in full; their value
+    is returned separately.
+    """
+    bundle_weights = []
+    bundle_values = []
+    free_value = 0
+
+    for weight, value, count in zip(weights, values, counts):
+        if weight == 0:
+            free_value += value * count
+            continue
+        count = min(count, capacity // weight)
+        size = 1
+        while count > 0:
+            size = min(size, count)
+            bundle_weights.append(weight * size)
+            bundle_values.append(value * size)
+            count -= size
+            size *= 2
+
+    return bundle_weights, bundle_values, free_value
+
+
+def bounded_knapsack(weights, values, counts, capacity, engine="python"):
+    """
+    Solve the Bounded Knapsack Problem: item type i may be taken up to
+    counts[i] times.
+
+    Expanding every copy into its own item would cost
+    O(capacity * sum(counts)). Binary splitting (see `_split_counts`)
+    reduces each type to O(log count) 0/1 bundles, which `knapsack` then
+    solves as usual.
+
+    Args:
+        weights: List of item weights (non-negative integers).
+        values:  List of item values (non-negative integers).
+        counts:  List of available copies per item (non-negative integers).
+        capacity: Maximum weight the knapsack can hold (non-negative integer).
+        engine:  Passed through to `knapsack` ("python" or "numpy").
+
+    Returns:
+        The maximum value achievable within the given capacity.
+
+    Time:  O(capacity * sum(log count))
+    Space: O(capacity)
+    """
+    if not weights or not values or capacity <= 0:
+        return 0
+
+    bundle_weights, bundle_values, free_value = _split_counts(weights, values, counts, capacity)
+    return free_value + knapsack(bundle_weights, bundle_values, capacity, engine=engine)
+
+
+def unbounded_knapsack(weights, values, capacity):
+    """
+    Solve the Unbounded Knapsack Problem: every item may be taken any
+    number of times.
+
+    The same 1D DP as `knapsack`, with the inner loop running FORWARD:
+    dp[j - weight] may already include this item, which is exactly what
+    allows it to be reused.
+
+    Args:
+        weights: List of item weights (positive integers; a weightless item
+                 with positive value would make the optimum unbounded).
+        values:  List of item values (non-negative integers).
+        capacity: Maximum weight the knapsack can hold (non-negative integer).
+
+    Returns:
+        The maximum value achievable within the given capacity.
+
+    Time:  O(n * capacity)
+    Space: O(capacity)
+    """
+    if not weights or not values or capacity <= 0:
+        return 0
+
+    if any(weight == 0 and value > 0 for weight, value in zip(weights, values)):
+        raise ValueError("a weightless item with positive value makes the optimum unbounded")
+
+    dp = [0] * (capacity + 1)
+
+    for weight, value in zip(weights, values):
+        if weight == 0 or weight > capacity:
+            continue
+        for j in range(weight, capacity + 1):
+            if dp[j - weight] + value > dp[j]:
+                dp[j] = dp[j - weight] + value
+
     return dp[capacity]
 
 
+def preprocess_knapsack(weights, values, capacity):
+    """
+    Shrink a 0/1 knapsack instance without changing its optimum.
+
+    1. Items heavier than the capacity are dropped.
+    2. Dominated items are dropped. Item j is dominated by item i when
+       i is no heavier and no less valuable. Unlike the unbounded case,
+       that alone is not enough in 0/1 knapsack (a packing may want both),
+       so j is only dropped when it cannot fit together with all of its
+       kept dominators: then any packing using j leaves one of them out,
+       and swapping j for it never loses value.
+    3. Weights and capacity are divided by the GCD of the weights; the
+       leftover capacity could never be used.
+    4. Items are sorted by value density, best first.
+
+    Items are visited lightest first (most valuable first among equal
+    weights), so every candidate's dominators have already been decided.
+    The total weight of the kept dominators of an item is a suffix sum
+    over value ranks, kept in a Fenwick tree.
+
+    Args:
+        weights: List of item weights (non-negative integers).
+        values:  List of item values (non-negative integers).
+        capacity: Maximum weight the knapsack can hold (non-negative integer).
+
+    Returns:
+        (weights, values, capacity, report) for the reduced problem, where
+        report is a dictionary with the original indices of the kept items
+        ("kept", in the new order), the GCD ("divisor"), and item, capacity
+        and DP cell counts before and after.
+
+    Time:  O(n log n)
+    """
+    capacity = max(capacity, 0)
+    candidates = [i for i in range(len(weights)) if weights[i] <= capacity]
+    candidates.sort(key=lambda i: (weights[i], -values[i]))
+
+    # Fenwick tree over value ranks, highest value = rank 1, holding the
+    # total weight of the kept items with that value
+    ranks = {value: rank for rank, value in
+             enumerate(sorted({values[i] for i in candidates}, reverse=True), 1)}
+    tree = [0] * (len(ranks) + 1)
+
+    kept = []
+    for i in candidates:
+        rank = ranks[values[i]]
+        dominator_weight = 0
+        r = rank
+        while r > 0:
+            dominator_weight += tree[r]
+            r -= r & -r
+        if dominator_weight + weights[i] > capacity:
+            continue  # cannot be packed with all its dominators: never needed
+        kept.append(i)
+        r = rank
+        while r < len(tree):
+            tree[r] += weights[i]
+            r += r & -r
+
+    divisor = reduce(gcd, (weights[i] for i in kept), 0) or 1
+    kept.sort(key=lambda i: values[i] / weights[i] if weights[i] else float("inf"),
+              reverse=True)
+
+    reduced_weights = [weights[i] // divisor for i in kept]
+    reduced_values = [values[i] for i in kept]
+    reduced_capacity = capacity // divisor
+
+    report = {
+        "kept": kept,
+        "divisor": divisor,
+        "items_before": len(weights),
+        "items_after": len(kept),
+        "capacity_before": capacity,
+        "capacity_after": reduced_capacity,
+        "cells_before": len(weights) * (capacity + 1),
+        "cells_after": len(kept) * (reduced_capacity + 1),
+    }
+    return reduced_weights, reduced_values, reduced_capacity, report
+
+
+def _subset_sums(weights, values):
+    """All (weight, value) sums over subsets of the given items."""
+    sums = [(0, 0)]
+    for weight, value in zip(weights, values):
+        sums += [(w + weight, v + value) for w, v in sums]
+    return sums
+
+
+def _knapsack_meet_in_the_middle(weights, values, capacity):
+    """
+    Meet-in-the-middle: split the items in two halves, enumerate each
+    half's 2^(n/2) subsets, and pair every left subset with the best right
+    subset that still fits. Independent of capacity, so it handles huge
+    capacities as long as n is small.
+
+    Time:  O(2^(n/2) * n)
+    """
+    half = len(weights) // 2
+    left = _subset_sums(weights[:half], values[:half])
+    right = sorted(_subset_sums(weights[half:], values[half:]))
+
+    # After sorting by weight, keep a running max of value so that
+    # best_value[k] is the best right subset weighing <= right_weights[k]
+    right_weights = [w for w, _ in right]
+    best_value = []
+    running = 0
+    for _, value in right:
+        running = max(running, value)
+        best_value.append(running)
+
+    best = 0
+    for weight, value in left:
+        if weight > capacity:
+            continue
+        k = bisect_right(right_weights, capacity - weight) - 1
+        best = max(best, value + best_value[k])
+    return best
+
+
+def _knapsack_branch_and_bound(weights, values, capacity):
+    """
+    Best-first branch and bound with the fractional (LP) relaxation bound.
+
+    Items are sorted by value density. A node has decided the first
+    `level` items; its bound fills the remaining capacity greedily in
+    density order and takes a fraction of the first item that does not fit.
+    With prefix sums of the sorted weights and values that bound is one
+    bisect. The bound is floored to an integer (the optimum is an integer),
+    keeping all arithmetic exact. Nodes are expanded in order of bound, so
+    the search stops as soon as no open node can beat the best packing.
+    """
+    # Weightless items are always worth taking; items that can never fit are dropped
+    base_value = sum(v for w, v in zip(weights, values) if w == 0)
+    items = sorted(((w, v) for w, v in zip(weights, values) if 0 < w <= capacity),
+                   key=lambda item: item[1] / item[0], reverse=True)
+    n = len(items)
+
+    prefix_weight = [0]
+    prefix_value = [0]
+    for weight, value in items:
+        prefix_weight.append(prefix_weight[-1] + weight)
+        prefix_value.append(prefix_value[-1] + value)
+
+    def bound(level, weight, value):
+        # Largest k such that items level..k-1 all fit on top of `weight`
+        k = bisect_right(prefix_weight, capacity - weight + prefix_weight[level]) - 1
+        result = value + prefix_value[k] - prefix_value[level]
+        if k < n:
+            room = capacity - weight - (prefix_weight[k] - prefix_weight[level])
+            result += room * items[k][1] // items[k][0]
+        return result
+
+    # Greedy packing in density order gives the starting lower bound
+    best = 0
+    room = capacity
+    for weight, value in items:
+        if weight <= room:
+            room -= weight
+            best += value
+
+    heap = [(-bound(0, 0, 0), 0, 0, 0)]  # (-bound, level, weight, value)
+    while heap:
+        negative_bound, level, weight, value = heapq.heappop(heap)
+        if -negative_bound <= best:
+            break  # no open node can improve on the best packing
+        if level == n:
+            continue
+
+        item_weight, item_value = items[level]
+        if weight + item_weight <= capacity:
+            taken_value = value + item_value
+            if taken_value > best:
+                best = taken_value
+            taken_bound = bound(level + 1, weight + item_weight, taken_value)
+            if taken_bound > best:
+                heapq.heappush(heap, (-taken_bound, level + 1, weight + item_weight, taken_value))
+
+        skipped_bound = bound(level + 1, weight, value)
+        if skipped_bound > best:
+            heapq.heappush(heap, (-skipped_bound, level + 1, weight, value))
+
+    return base_value + best
+
+
+def choose_knapsack_method(weights, capacity):
+    """
+    Pick the solver for `solve_knapsack` from the shape of the problem.
+
+    Weights and capacity are first divided by the GCD of the weights (no
+    packing can use the leftover capacity), then:
+    - DP when n * reduced capacity is at most DP_CELL_LIMIT
+    - meet-in-the-middle when n <= MITM_MAX_ITEMS
+    - branch and bound otherwise
+    """
+    divisor = reduce(gcd, weights, 0) or 1
+    if len(weights) * (capacity // divisor) <= DP_CELL_LIMIT:
+        return "dp"
+    if len(weights) <= MITM_MAX_ITEMS:
+        return "meet_in_the_middle"
+    return "branch_and_bound"
+
+
+def solve_knapsack(weights, values, capacity, method="auto"):
+    """
+    Solve the 0/1 Knapsack Problem with the solver best suited to its shape.
+
+    Always returns the same optimum as `knapsack`, but does not require
+    n * capacity work: 40 items with capacity 10^12 go to meet-in-the-
+    middle, and thousands of items with a huge capacity go to branch and
+    bound. The instance is reduced by `preprocess_knapsack` first.
+
+    Args:
+        weights: List of item weights (non-negative integers).
+        values:  List of item values (non-negative integers).
+        capacity: Maximum weight the knapsack can hold (non-negative integer).
+        method:  "auto" (see `choose_knapsack_method`), "dp",
+                 "meet_in_the_middle" or "branch_and_bound".
+
+    Returns:
+        The maximum value achievable within the given capacity.
+    """
+    if method not in KNAPSACK_METHODS:
+        raise ValueError(f"method must be one of {KNAPSACK_METHODS}, got {method!r}")
+
+    if not weights or not values or capacity <= 0:
+        return 0
+
+    weights, values, capacity, _ = preprocess_knapsack(weights, values, capacity)
+    if not weights:
+        return 0
+
+    if method == "auto":
+        method = choose_knapsack_method(weights, capacity)
+
+    if method == "meet_in_the_middle":
+        return _knapsack_meet_in_the_middle(weights, values, capacity)
+    if method == "branch_and_bound":
+        return _knapsack_branch_and_bound(weights, values, capacity)
+
+    engine = "numpy" if len(weights) * capacity > NUMPY_DP_CELLS else "python"
+    return knapsack(weights, values, capacity, engine=engine)
+
+
+def knapsack_capacities(weights, values, capacities, engine="python"):
+    """
+    Answer `knapsack` for many capacities over the same items in one pass.
+
+    The DP array filled for the largest capacity already holds the answer
+    for every smaller capacity (dp[j] is the optimum for capacity j), so
+    one table serves them all.
+
+    Args:
+        weights: List of item weights (non-negative integers).
+        values:  List of item values (non-negative integers).
+        capacities: Iterable of capacities (integers).
+        engine:  "python" or "numpy", as for `knapsack`.
+
+    Returns:
+        List of maximum values, one per capacity, in input order.
+
+    Time:  O(n * max(capacities))
+    """
+    if engine not in KNAPSACK_ENGINES:
+        raise ValueError(f"engine must be one of {KNAPSACK_ENGINES}, got {engine!r}")
+
+    capacities = list(capacities)
+    largest = max(capacities, default=0)
+    if not weights or not values or largest <= 0:
+        return [0] * len(capacities)
+
+    dp = _knapsack_table(weights, values, largest, engine)
+    if engine == "numpy":
+        dp = dp.tolist()
+    return [dp[capacity] if capacity > 0 else 0 for capacity in capacities]
+
+
+def _solve_knapsack_args(args):
+    """Unpack arguments for ProcessPoolExecutor.map()."""
+    return solve_knapsack(*args)
+
+
+def solve_knapsack_batch(instances, method="auto", processes=None, chunksize=16):
+    """
+    Solve many independent knapsack instances, in parallel across processes.
+
+    Args:
+        instances: Iterable of (weights, values, capacity) tuples.
+        method:    Solver for every instance, as for `solve_knapsack`.
+        processes: Worker processes (default: one per CPU); 1 solves them
+                   in this process.
+        chunksize: Instances sent to a worker at a time, to amortize the
+                   cost of pickling many small problems.
+
+    Returns:
+        List of maximum values, in input order.
+    """
+    jobs = [(weights, values, capacity, method) for weights, values, capacity in instances]
+
+    if processes == 1:
+        return [_solve_knapsack_args(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(_solve_knapsack_args, jobs, chunksize=chunksize))
+
+
 # ---------------------------------------------------------------------------
 # Demo / Tests
 # ---------------------------------------------------------------------------
@@ -105,8 +682,12 @@ def main():
     all_passed = True
     for desc, weights, values, capacity, expected in test_cases:
         result = knapsack(weights, values, capacity)
-        status = "PASS" if result == expected else "FAIL"
-        if result != expected:
+        numpy_result = knapsack(weights, values, capacity, engine="numpy")
+        solver_results = [solve_knapsack(weights, values, capacity, method)
+                          for method in KNAPSACK_METHODS]
+        agree = all(r == expected for r in [numpy_result] + solver_results)
+        status = "PASS" if result == expected and agree else "FAIL"
+        if status == "FAIL":
             all_passed = False
         print(f"\n{desc}:")
         print(f"  Weights:  {weights}")
@@ -114,6 +695,131 @@ def main():
         print(f"  Capacity: {capacity}")
         print(f"  Expected: {expected}, Got: {result} [{status}]")
 
+        # The reconstructed selection must fit and add up to the same value
+        best, selected = knapsack_with_items(weights, values, capacity)
+        valid = (best == expected
+                 and sum(weights[i] for i in selected) <= capacity
+                 and sum(values[i] for i in selected) == best)
+        if not valid:
+            all_passed = False
+        print(f"  Items:    {selected} [{'PASS' if valid else 'FAIL'}]")
+
+    print("\n" + "-" * 55)
+    print("Feasibility mode (values equal weights)")
+
+    feasibility_cases = [
+        # (description, weights, capacity, expected best weight)
+        ("No items", [], 10, 0),
+        ("Exact fit", [3, 5, 7], 12, 12),
+        ("Gap below capacity", [4, 6], 9, 6),
+        ("Large capacity", [999_983, 1_000_003, 12_345], 2_012_331, 2_012_331),
+    ]
+
+    for desc, weights, capacity, expected in feasibility_cases:
+        best, reachable = knapsack_reachable(weights, capacity)
+        valid = best == expected and reachable >> best & 1
+        if not valid:
+            all_passed = False
+        print(f"  {desc:20s} best={best:<10} expected={expected:<10} "
+              f"[{'PASS' if valid else 'FAIL'}]")
+
+    print("\n" + "-" * 55)
+    print("Bounded and unbounded variants")
+
+    bounded_cases = [
+        # (description, weights, values, counts, capacity, expected)
+        ("Counts limit the best item", [3, 4], [5, 6], [1, 5], 10, 12),
+        ("Zero counts", [1, 2], [10, 20], [0, 0], 10, 0),
+        ("Large counts", [7, 11], [9, 15], [10_000, 10_000], 100, 135),
+    ]
+
+    for desc, weights, values, counts, capacity, expected in bounded_cases:
+        result = bounded_knapsack(weights, values, counts, capacity)
+        # Expanding every copy into a 0/1 item must give the same answer
+        copies = [min(c, capacity // w) for w, c in zip(weights, counts)]
+        expanded = knapsack([w for w, c in zip(weights, copies) for _ in range(c)],
+                            [v for v, c in zip(values, copies) for _ in range(c)],
+                            capacity)
+        valid = result == expected == expanded
+        if not valid:
+            all_passed = False
+        print(f"  {desc:26s} bounded={result:<6} expected={expected:<6} "
+              f"[{'PASS' if valid else 'FAIL'}]")
+
+    unbounded_cases = [
+        # (description, weights, values, capacity, expected)
+        ("Reuse the densest item", [2, 3], [3, 5], 10, 16),
+        ("Coin-style fill", [5, 10, 25], [5, 10, 25], 30, 30),
+        ("Nothing fits", [8], [10], 7, 0),
+    ]
+
+    for desc, weights, values, capacity, expected in unbounded_cases:
+        result = unbounded_knapsack(weights, values, capacity)
+        # Unbounded equals bounded with enough copies of everything
+        as_bounded = bounded_knapsack(weights, values, [capacity] * len(weights), capacity)
+        valid = result == expected == as_bounded
+        if not valid:
+            all_passed = False
+        print(f"  {desc:26s} unbounded={result:<4} expected={expected:<6} "
+              f"[{'PASS' if valid else 'FAIL'}]")
+
+    print("\n" + "-" * 55)
+    print("Preprocessing (dominance pruning and weight scaling)")
+
+    # Multiples of 50 with many near-duplicate, dominated items
+    weights = [50 * (1 + i % 40) for i in range(400)]
+    values = [(7 * i) % 97 + weights[i] // 25 for i in range(400)]
+    capacity = 5_025
+    reduced_weights, reduced_values, reduced_capacity, report = preprocess_knapsack(
+        weights, values, capacity)
+    expected = knapsack(weights, values, capacity)
+    result = knapsack(reduced_weights, reduced_values, reduced_capacity)
+    valid = result == expected
+    if not valid:
+        all_passed = False
+    print(f"  Items {report['items_before']} -> {report['items_after']}, "
+          f"capacity {report['capacity_before']} -> {report['capacity_after']} "
+          f"(divisor {report['divisor']})")
+    print(f"  DP cells {report['cells_before']:,} -> {report['cells_after']:,} "
+          f"({report['cells_before'] / report['cells_after']:.0f}x smaller)")
+    print(f"  Expected: {expected}, Got: {result} [{'PASS' if valid else 'FAIL'}]")
+
+    print("\n" + "-" * 55)
+    print("Automatic solver selection")
+
+    # 40 items, capacity 10^12: infeasible for DP, trivial for meet-in-the-middle
+    weights = [10 ** 10 + 7919 * i * i for i in range(40)]
+    values = [(w // 10 ** 6) % 9973 + i for i, w in enumerate(weights)]
+    capacity = 10 ** 12 // 5
+    method = choose_knapsack_method(weights, capacity)
+    result = solve_knapsack(weights, values, capacity)
+    expected = _knapsack_branch_and_bound(weights, values, capacity)
+    if result != expected:
+        all_passed = False
+    print(f"  40 items, capacity {capacity:,}: method={method}, "
+          f"value={result} [{'PASS' if result == expected else 'FAIL'}]")
+
+    print("\n" + "-" * 55)
+    print("Batch solving")
+
+    weights, values = [2, 3, 4, 5], [3, 4, 5, 6]
+    capacities = [5, 0, 14, 3, 9]
+    expected = [knapsack(weights, values, capacity) for capacity in capacities]
+    result = knapsack_capacities(weights, values, capacities)
+    valid = result == expected == knapsack_capacities(weights, values, capacities, "numpy")
+    if not valid:
+        all_passed = False
+    print(f"  Capacities {capacities}: {result} [{'PASS' if valid else 'FAIL'}]")
+
+    instances = [(w, v, c) for _, w, v, c, _ in test_cases]
+    expected = [e for *_, e in test_cases]
+    result = solve_knapsack_batch(instances, processes=2)
+    valid = result == expected
+    if not valid:
+        all_passed = False
+    print(f"  {len(instances)} instances across 2 processes: {result} "
+          f"[{'PASS' if valid else 'FAIL'}]")
+
     print("\n" + "=" * 55)
     if all_passed:
         print("All tests passed!")
@@ -0,0 +1,279 @@
+"""
+Memory-Mapped Binary Search
+Binary search directly over sorted files, without loading them.
+
+The file is memory-mapped read-only and searched in place: each probe
+reads one key from the mapping, so a search touches O(log n) pages and
+materializes O(log n) small key objects, however large the file is.
+Records and lines are returned as memoryview slices of the mapping, not
+copies.
+
+Two file formats:
+- RecordFile: fixed-width binary records sorted by a key field, either a
+  struct-packed number (e.g. ">q") or raw bytes compared bytewise.
+- LineFile: text lines sorted bytewise (as `LC_ALL=C sort` produces),
+  keyed by the whole line or by the field before a delimiter. Probes land
+  at arbitrary byte offsets and are realigned to the start of their line.
+
+Both support exact match, lower_bound, upper_bound and range scans. Close
+the file (or use it as a context manager) only after releasing any
+memoryviews it returned.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left, bisect_right
+
+
+def _map(fh):
+    """Map a whole file read-only; empty files (which mmap rejects) map to b""."""
+    size = os.fstat(fh.fileno()).st_size
+    if size == 0:
+        return b""
+    return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class _MappedFile:
+    """Open file + read-only mapping, closed together."""
+
+    def __init__(self, path):
+        self._fh = open(path, "rb")
+        self.data = _map(self._fh)
+        self.view = memoryview(self.data)
+
+    def close(self):
+        self.view.release()
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RecordFile(_MappedFile):
+    """
+    A file of fixed-width records sorted by a key field.
+
+    Positions are record numbers: lower_bound/upper_bound return 0..n and
+    find returns -1 when the key is missing, like `binary_search`.
+    """
+
+    def __init__(self, path, record_size, key_offset=0, key_format=">q", key_size=None):
+        """
+        Args:
+            path: File of len(file) // record_size records.
+            record_size: Bytes per record.
+            key_offset: Byte offset of the key within a record.
+            key_format: `struct` format of the key (default big-endian
+                        int64), or None to compare `key_size` raw bytes.
+            key_size: Key width in bytes when key_format is None.
+        """
+        super().__init__(path)
+        if key_format is None and not key_size:
+            raise ValueError("key_size is required when key_format is None")
+
+        self.record_size = record_size
+        self.key_offset = key_offset
+        self.n = len(self.data) // record_size
+        self._struct = struct.Struct(key_format) if key_format is not None else None
+        self._key_size = key_size
+
+    def __len__(self):
+        return self.n
+
+    def key(self, i):
+        """Key of record i (one small object per call)."""
+        start = i * self.record_size + self.key_offset
+        if self._struct is not None:
+            return self._struct.unpack_from(self.data, start)[0]
+        return self.data[start:start + self._key_size]
+
+    def record(self, i):
+        """Record i as a memoryview into the mapping."""
+        start = i * self.record_size
+        return self.view[start:start + self.record_size]
+
+    def _bound(self, target, right):
+        left, hi = 0, self.n
+        key = self.key
+        while left < hi:
+            mid = (left + hi) // 2
+            k = key(mid)
+            if k < target or (right and k == target):
+                left = mid + 1
+            else:
+                hi = mid
+        return left
+
+    def lower_bound(self, target):
+        """Number of the first record with key >= target (n if none)."""
+        return self._bound(target, False)
+
+    def upper_bound(self, target):
+        """Number of the first record with key > target (n if none)."""
+        return self._bound(target, True)
+
+    def find(self, target):
+        """Number of the first record with this key, or -1 if missing."""
+        i = self.lower_bound(target)
+        return i if i < self.n and self.key(i) == target else -1
+
+    def range(self, low, high):
+        """Yield records with low <= key < high, in order."""
+        for i in range(self.lower_bound(low), self.lower_bound(high)):
+            yield self.record(i)
+
+
+class LineFile(_MappedFile):
+    """
+    A text file of lines sorted bytewise by key.
+
+    Positions are byte offsets of line starts: lower_bound/upper_bound
+    return an offset (the file size if none), find returns -1 when the key
+    is missing. Keys and targets are bytes.
+    """
+
+    def __init__(self, path, delimiter=None):
+        """
+        Args:
+            path: Sorted text file, one record per line.
+            delimiter: If given (e.g. b","), a line's key is the part before
+                       the first delimiter; otherwise the whole line.
+        """
+        super().__init__(path)
+        self.size = len(self.data)
+        self.delimiter = delimiter
+
+    def _line_end(self, start):
+        end = self.data.find(b"\n", start)
+        return self.size if end < 0 else end
+
+    def _key(self, start, end):
+        if self.delimiter is not None:
+            split = self.data.find(self.delimiter, start, end)
+            if split >= 0:
+                end = split
+        return self.data[start:end]
+
+    def _bound(self, target, right):
+        # Invariant: `left` is a line start and every line before it has a
+        # key < target (<= for right); no line at or after `hi` is needed.
+        data = self.data
+        left, hi = 0, self.size
+        while left < hi:
+            mid = (left + hi) // 2
+            # Realign the probe to the start of the line containing mid
+            start = data.rfind(b"\n", left, mid) + 1 or left
+            end = self._line_end(start)
+            key = self._key(start, end)
+            if key < target or (right and key == target):
+                left = min(end + 1, self.size)
+            else:
+                hi = start
+        return left
+
+    def lower_bound(self, target):
+        """Offset of the first line with key >= target (file size if none)."""
+        return self._bound(target, False)
+
+    def upper_bound(self, target):
+        """Offset of the first line with key > target (file size if none)."""
+        return self._bound(target, True)
+
+    def line(self, offset):
+        """The line starting at offset, without its newline, as a memoryview."""
+        return self.view[offset:self._line_end(offset)]
+
+    def find(self, target):
+        """Offset of the first line with this key, or -1 if missing."""
+        offset = self.lower_bound(target)
+        if offset < self.size and self._key(offset, self._line_end(offset)) == target:
+            return offset
+        return -1
+
+    def range(self, low, high):
+        """Yield lines with low <= key < high, in order, without newlines."""
+        offset = self.lower_bound(low)
+        stop = self.lower_bound(high)
+        while offset < stop:
+            end = self._line_end(offset)
+            yield self.view[offset:end]
+            offset = end + 1
+
+
+# ---------------------------------------------------------------------------
+# Demo / Tests
+# ---------------------------------------------------------------------------
+def main():
+    print("Memory-Mapped Binary Search Test Results")
+    print("=" * 70)
+
+    all_passed = True
+
+    def check(label, passed):
+        nonlocal all_passed
+        if not passed:
+            all_passed = False
+        print(f"{'PASS' if passed else 'FAIL'}  {label}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Binary records: big-endian int64 key + int64 payload, with repeats
+        keys = sorted(k // 3 * 7 for k in range(3000))
+        record_path = os.path.join(tmp, "records.bin")
+        with open(record_path, "wb") as fh:
+            for i, k in enumerate(keys):
+                fh.write(struct.pack(">qq", k, i))
+
+        with RecordFile(record_path, record_size=16) as records:
+            queries = range(-3, keys[-1] + 4)
+            check("Records: lower_bound matches bisect_left",
+                  all(records.lower_bound(q) == bisect_left(keys, q) for q in queries))
+            check("Records: upper_bound matches bisect_right",
+                  all(records.upper_bound(q) == bisect_right(keys, q) for q in queries))
+            check("Records: find returns first occurrence or -1",
+                  all(records.find(q) == (bisect_left(keys, q) if q in keys else -1)
+                      for q in queries[:200]))
+            scanned = [struct.unpack(">qq", r)[1] for r in records.range(70, 140)]
+            check("Records: range scan [70, 140)",
+                  scanned == list(range(bisect_left(keys, 70), bisect_left(keys, 140))))
+
+        with RecordFile(record_path, record_size=16, key_format=None, key_size=8) as records:
+            check("Records: raw byte keys",
+                  records.find(struct.pack(">q", 700)) == bisect_left(keys, 700))
+
+        # Sorted text lines keyed by the field before ","
+        words = sorted({f"{w:05d}" for w in range(0, 50000, 37)})
+        line_path = os.path.join(tmp, "lines.txt")
+        with open(line_path, "wb") as fh:
+            for w in words:
+                fh.write(f"{w},payload-{w}\n".encode())
+
+        with LineFile(line_path, delimiter=b",") as lines:
+            offset = lines.find(b"00037")
+            check("Lines: exact match",
+                  offset >= 0 and bytes(lines.line(offset)) == b"00037,payload-00037")
+            check("Lines: missing key", lines.find(b"00038") == -1)
+            check("Lines: every key found",
+                  all(lines.find(w.encode()) >= 0 for w in words))
+            expected = [w for w in words if "01000" <= w < "01200"]
+            got = [bytes(line).split(b",")[0].decode() for line in lines.range(b"01000", b"01200")]
+            check("Lines: range scan [01000, 01200)", got == expected)
+            check("Lines: past the end", lines.lower_bound(b"99999") == lines.size)
+
+        empty_path = os.path.join(tmp, "empty.txt")
+        open(empty_path, "wb").close()
+        with LineFile(empty_path) as lines:
+            check("Empty file", lines.find(b"x") == -1 and list(lines.range(b"a", b"z")) == [])
+
+    print("=" * 70)
+    print(f"All tests passed: {all_passed}")
+
+
+if __name__ == "__main__":
+    main()
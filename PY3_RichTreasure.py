@@ -3,12 +3,27 @@ Financial Calculator Suite
 A comprehensive tool for stock trading commission calculations and financial analysis
 """
 
+import financial_kernel as kernel
+
+# Seven levels (chakras) with their golden ratio multipliers (down, up),
+# taken from the shared golden ratio table
+CHAKRA_NAMES = [
+    "Root Chakra",
+    "Sacral Chakra",
+    "Solar Plexus Chakra",
+    "Heart Chakra",
+    "Throat Chakra",
+    "Third Eye Chakra",
+    "Crown Chakra",
+]
+CHAKRA_LEVELS = list(zip(CHAKRA_NAMES, kernel.DOWN_RATIOS, kernel.UP_RATIOS))
+
 
 # ==================== CALCULATION FUNCTIONS ====================
 
 def calculate_gross_profit(sell_price, buy_price, shares):
     """Calculate gross profit from stock transaction."""
-    return sell_price * shares - buy_price * shares
+    return kernel.gross_profit(sell_price, buy_price, shares)
 
 
 def calculate_commission(price, shares, commission_rate, minimum=5.0):
@@ -24,8 +39,7 @@ def calculate_commission(price, shares, commission_rate, minimum=5.0):
     Returns:
         Commission fee amount
     """
-    commission = price * shares * commission_rate
-    return commission if commission > minimum else minimum
+    return kernel.commission(price, shares, commission_rate, minimum)
 
 
 def calculate_annual_rate(principal, days, profit):
@@ -34,7 +48,7 @@ def calculate_annual_rate(principal, days, profit):
 
     Formula: APR = (profit / days) * 365 / principal * 100
     """
-    return profit / days * 365 / principal * 100
+    return kernel.apr_from_profit(principal, days, profit)
 
 
 def calculate_profit_from_rate(principal, days, annual_rate):
@@ -43,12 +57,12 @@ def calculate_profit_from_rate(principal, days, annual_rate):
 
     Formula: Profit = principal * annual_rate / 365 * days / 100
     """
-    return principal * annual_rate / 365 * days / 100
+    return kernel.profit_from_annual_rate(principal, days, annual_rate)
 
 
 def calculate_golden_ratio_level(base_price, multiplier):
     """Calculate price level using golden ratio multiplier."""
-    return base_price * multiplier
+    return kernel.golden_ratio_level(base_price, multiplier)
 
 
 def calculate_support_resistance(high_point, low_point, ratio):
@@ -63,10 +77,7 @@ def calculate_support_resistance(high_point, low_point, ratio):
     Returns:
         Tuple of (support_level, resistance_level)
     """
-    price_range = high_point - low_point
-    support_level = high_point - price_range * ratio
-    resistance_level = support_level + price_range * (1 + ratio)
-    return support_level, resistance_level
+    return kernel.support_resistance(high_point, low_point, ratio)
 
 
 # ==================== BRANCH HANDLERS ====================
@@ -89,43 +100,29 @@ def branch_1_commission_calculator():
         shares = float(input("Number of shares: "))
         print()
 
-        # Constants (Chinese market specific)
-        COMMISSION_RATE = 0.0003      # 0.03% commission rate (set by broker)
-        TRANSFER_FEE_RATE = 0.00002   # 0.002% transfer fee (national standard)
-        STAMP_DUTY_RATE = 0.001       # 0.1% stamp duty (national standard)
-        MINIMUM_COMMISSION = 5.0      # Minimum 5 CNY commission
-
-        # Calculations
+        # Calculations (Chinese market rates from the shared kernel)
         gross_profit = calculate_gross_profit(sell_price, buy_price, shares)
         print(f"Gross Profit: {gross_profit:.2f} CNY")
+        costs = kernel.trading_costs(buy_price, sell_price, shares)
 
         # Buy-side fees
-        commission_buy = calculate_commission(buy_price, shares, COMMISSION_RATE, MINIMUM_COMMISSION)
-        print(f"Commission (Buy): {commission_buy:.2f} CNY")
+        print(f"Commission (Buy): {costs['commission_buy']:.2f} CNY")
 
         # Sell-side fees
-        commission_sell = calculate_commission(sell_price, shares, COMMISSION_RATE, MINIMUM_COMMISSION)
-        print(f"Commission (Sell): {commission_sell:.2f} CNY")
+        print(f"Commission (Sell): {costs['commission_sell']:.2f} CNY")
 
         # Stamp duty (only on sell)
-        stamp_duty = sell_price * shares * STAMP_DUTY_RATE
-        print(f"Stamp Duty: {stamp_duty:.2f} CNY")
+        print(f"Stamp Duty: {costs['stamp_duty']:.2f} CNY")
 
         # Transfer fees
-        transfer_fee_buy = buy_price * shares * TRANSFER_FEE_RATE
-        print(f"Transfer Fee (Buy): {transfer_fee_buy:.2f} CNY")
-
-        transfer_fee_sell = sell_price * shares * TRANSFER_FEE_RATE
-        print(f"Transfer Fee (Sell): {transfer_fee_sell:.2f} CNY")
+        print(f"Transfer Fee (Buy): {costs['transfer_fee_buy']:.2f} CNY")
+        print(f"Transfer Fee (Sell): {costs['transfer_fee_sell']:.2f} CNY")
 
         # Total fees breakdown
-        total_buy_fees = commission_buy + transfer_fee_buy
-        print(f"Total Buy Fees: {total_buy_fees:.2f} CNY")
+        print(f"Total Buy Fees: {costs['cost_buy']:.2f} CNY")
+        print(f"Total Sell Fees: {costs['cost_sell']:.2f} CNY")
 
-        total_sell_fees = commission_sell + transfer_fee_sell + stamp_duty
-        print(f"Total Sell Fees: {total_sell_fees:.2f} CNY")
-
-        total_fees = round(total_buy_fees + total_sell_fees, 2)
+        total_fees = round(costs['total_cost'], 2)
         print(f"Total Fees: {total_fees} CNY")
 
         # Net profit
@@ -155,25 +152,21 @@ def branch_2_golden_ratio_single_base():
     print(f"Base Price: {base_price}")
     print('------- Finding Resistance in Uptrend -------\n')
 
+    supports, resistances = kernel.golden_ratio_single(base_price)
+
     # Upside resistance levels (Crown to Root chakra)
-    print(f"Base Price × 1.809 (Crown Chakra), Level +7: {calculate_golden_ratio_level(base_price, 1.809):.2f}\n")
-    print(f"Base Price × 1.764 (Third Eye Chakra), Level +6: {calculate_golden_ratio_level(base_price, 1.764):.2f}\n")
-    print(f"Base Price × 1.618 (Throat Chakra), Level +5: {calculate_golden_ratio_level(base_price, 1.618):.2f}\n")
-    print(f"Base Price × 1.500 (Heart Chakra), Level +4: {calculate_golden_ratio_level(base_price, 1.500):.2f}\n")
-    print(f"Base Price × 1.382 (Solar Plexus Chakra), Level +3: {calculate_golden_ratio_level(base_price, 1.382):.2f}\n")
-    print(f"Base Price × 1.236 (Sacral Chakra), Level +2: {calculate_golden_ratio_level(base_price, 1.236):.2f}\n")
-    print(f"Base Price × 1.191 (Root Chakra), Level +1: {calculate_golden_ratio_level(base_price, 1.191):.2f}\n")
+    for i in range(len(CHAKRA_LEVELS), 0, -1):
+        chakra_name, _, ratio_up = CHAKRA_LEVELS[i - 1]
+        print(f"Base Price × {ratio_up:.3f} ({chakra_name}), Level +{i}: {resistances[i - 1]:.2f}\n")
 
     print('------- Finding Support in Downtrend -------\n')
 
     # Downside support levels (Root to Crown chakra)
-    print(f"Base Price × 0.809 (Root Chakra), Level -1: {calculate_golden_ratio_level(base_price, 0.809):.2f}\n")
-    print(f"Base Price × 0.764 (Sacral Chakra), Level -2: {calculate_golden_ratio_level(base_price, 0.764):.2f}\n")
-    print(f"Base Price × 0.618 (Solar Plexus Chakra), Level -3: {calculate_golden_ratio_level(base_price, 0.618):.2f}\n")
-    print(f"Base Price × 0.500 (Heart Chakra), Level -4: {calculate_golden_ratio_level(base_price, 0.500):.2f}\n")
-    print(f"Base Price × 0.382 (Throat Chakra), Level -5: {calculate_golden_ratio_level(base_price, 0.382):.2f}\n")
-    print(f"Base Price × 0.236 (Third Eye Chakra), Level -6: {calculate_golden_ratio_level(base_price, 0.236):.2f}\n")
-    print(f"Base Price × 0.191 (Crown Chakra), Level -7: {calculate_golden_ratio_level(base_price, 0.191):.2f}\n")
+    for i in range(len(CHAKRA_LEVELS), 0, -1):
+        _, ratio_down, _ = CHAKRA_LEVELS[i - 1]
+        chakra_name = CHAKRA_NAMES[len(CHAKRA_LEVELS) - i]
+        level = len(CHAKRA_LEVELS) + 1 - i
+        print(f"Base Price × {ratio_down:.3f} ({chakra_name}), Level -{level}: {supports[i - 1]:.2f}\n")
 
 
 def branch_3_golden_ratio_dual_base():
@@ -189,18 +182,7 @@ def branch_3_golden_ratio_dual_base():
     print(f"--- High Point ---: {high_point}")
     print(f"--- Low Point ---: {low_point}\n")
 
-    # Seven levels (chakras) with their golden ratio multipliers
-    levels = [
-        ("Root Chakra", 0.191, 1.191),
-        ("Sacral Chakra", 0.236, 1.236),
-        ("Solar Plexus Chakra", 0.382, 1.382),
-        ("Heart Chakra", 0.500, 1.500),
-        ("Throat Chakra", 0.618, 1.618),
-        ("Third Eye Chakra", 0.764, 1.764),
-        ("Crown Chakra", 0.809, 1.809)
-    ]
-
-    for i, (chakra_name, ratio_down, ratio_up) in enumerate(levels, 1):
+    for i, (chakra_name, ratio_down, ratio_up) in enumerate(CHAKRA_LEVELS, 1):
         print(f"--- Level {i} ({chakra_name}): {ratio_down} & {ratio_up} ---")
         support, resistance = calculate_support_resistance(high_point, low_point, ratio_down)
         print(f"Downtrend Support: {support:.2f}")
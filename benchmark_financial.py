@@ -0,0 +1,249 @@
+"""
+Financial Benchmarks
+Speed and equivalence checks for the calculations in financial_calculator.py
+and PY3_RichTreasure.py.
+
+For each calculation this measures:
+- scalar overhead: best time per call with plain float arguments
+- batch throughput: rows/sec for array inputs of 1, 10, ... up to --max-size
+- equivalence: scalar results in a loop match the batch results
+
+Results can be saved as a JSON baseline and later compared against one;
+the run fails when any timing is slower than the baseline by more than
+the tolerance, or when scalar and batch results disagree.
+
+Usage:
+  python benchmark_financial.py --save baseline.json
+  python benchmark_financial.py --compare baseline.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+
+import numpy as np
+
+import financial_calculator as fc
+import financial_kernel as kernel
+import PY3_RichTreasure as rich
+
+
+def _random_inputs(rng, size):
+    """Realistic input columns shared by all cases."""
+    buy_price = np.round(rng.uniform(1, 200, size), 2)
+    return {
+        "buy_price": buy_price,
+        "sell_price": np.round(buy_price * rng.uniform(0.9, 1.1, size), 2),
+        "share_volume": rng.integers(1, 1000, size) * 100.0,
+        "principal": rng.uniform(1000, 1e6, size),
+        "days": rng.integers(1, 730, size).astype(float),
+        "profit": rng.uniform(-1e4, 1e5, size),
+        "apr": rng.uniform(0, 20, size),
+        "daily_income": rng.uniform(0, 500, size),
+        "budget": rng.uniform(0, 1e6, size),
+        "high_point": buy_price * 1.2,
+        "low_point": buy_price,
+        "ratio": np.full(size, 0.618),
+        "multiplier": np.full(size, 1.618),
+    }
+
+
+# Each case: name -> (scalar function, batch function, input columns)
+# Both functions return one comparable number (or 1-D array) per row.
+CASES = {
+    "financial_calculator.calculate_gross_profit": (
+        fc.calculate_gross_profit, fc.calculate_gross_profit,
+        ("sell_price", "buy_price", "share_volume")),
+    "financial_calculator.calculate_trading_costs": (
+        lambda b, s, v: fc.calculate_trading_costs(b, s, v)["total_cost"],
+        lambda b, s, v: fc.calculate_trading_costs_batch(b, s, v)["total_cost"],
+        ("buy_price", "sell_price", "share_volume")),
+    "financial_calculator.calculate_commission": (
+        fc.calculate_commission, fc.calculate_commission,
+        ("buy_price", "share_volume")),
+    "financial_calculator.calculate_stamp_duty": (
+        fc.calculate_stamp_duty, fc.calculate_stamp_duty,
+        ("sell_price", "share_volume")),
+    "financial_calculator.calculate_transfer_fee": (
+        fc.calculate_transfer_fee, fc.calculate_transfer_fee,
+        ("buy_price", "share_volume")),
+    "financial_calculator.calculate_break_even_sell_price": (
+        fc.calculate_break_even_sell_price, fc.calculate_break_even_sell_price,
+        ("buy_price", "share_volume")),
+    "financial_calculator.calculate_optimal_order_size": (
+        lambda p, b: fc.calculate_optimal_order_size(p, b)["lots"],
+        lambda p, b: fc.calculate_optimal_order_size(p, b)["lots"],
+        ("buy_price", "budget")),
+    "financial_calculator.calculate_golden_ratio_single": (
+        lambda b: fc.calculate_golden_ratio_single(b)["resistance"][4]["price"],
+        lambda b: np.round(kernel.golden_ratio_single(b)[1][:, 4], 2),
+        ("buy_price",)),
+    "financial_calculator.calculate_golden_ratio_dual": (
+        lambda h, l: fc.calculate_golden_ratio_dual(h, l)[4]["support"],
+        lambda h, l: np.round(kernel.golden_ratio_dual(h, l)[0][:, 4], 2),
+        ("high_point", "low_point")),
+    "financial_calculator.calculate_apr_from_profit": (
+        fc.calculate_apr_from_profit, fc.calculate_apr_from_profit,
+        ("principal", "days", "profit")),
+    "financial_calculator.calculate_profit_from_apr": (
+        fc.calculate_profit_from_apr, fc.calculate_profit_from_apr,
+        ("principal", "days", "apr")),
+    "financial_calculator.calculate_daily_income": (
+        fc.calculate_daily_income, fc.calculate_daily_income,
+        ("principal", "apr")),
+    "financial_calculator.calculate_apr_from_daily_income": (
+        fc.calculate_apr_from_daily_income, fc.calculate_apr_from_daily_income,
+        ("principal", "daily_income")),
+    "PY3_RichTreasure.calculate_gross_profit": (
+        rich.calculate_gross_profit, rich.calculate_gross_profit,
+        ("sell_price", "buy_price", "share_volume")),
+    "PY3_RichTreasure.calculate_commission": (
+        lambda p, v: rich.calculate_commission(p, v, 0.0003),
+        lambda p, v: rich.calculate_commission(p, v, 0.0003),
+        ("buy_price", "share_volume")),
+    "PY3_RichTreasure.calculate_annual_rate": (
+        rich.calculate_annual_rate, rich.calculate_annual_rate,
+        ("principal", "days", "profit")),
+    "PY3_RichTreasure.calculate_profit_from_rate": (
+        rich.calculate_profit_from_rate, rich.calculate_profit_from_rate,
+        ("principal", "days", "apr")),
+    "PY3_RichTreasure.calculate_golden_ratio_level": (
+        rich.calculate_golden_ratio_level, rich.calculate_golden_ratio_level,
+        ("buy_price", "multiplier")),
+    "PY3_RichTreasure.calculate_support_resistance": (
+        lambda h, l, r: rich.calculate_support_resistance(h, l, r)[0],
+        lambda h, l, r: rich.calculate_support_resistance(h, l, r)[0],
+        ("high_point", "low_point", "ratio")),
+}
+
+
+# =============================================================================
+# MEASUREMENTS
+# =============================================================================
+
+def scalar_overhead_ns(function, args, number=2000, repeat=5):
+    """Best time per scalar call in nanoseconds."""
+    timer = timeit.Timer(lambda: function(*args))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def batch_rows_per_second(function, columns, min_seconds=0.2):
+    """Rows per second for one batch call, repeated until min_seconds have passed."""
+    rows = len(columns[0])
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        function(*columns)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return rows * calls / elapsed
+
+
+def check_equivalence(scalar, batch, columns, rows=1000):
+    """Return the worst relative difference between scalar and batch results."""
+    columns = [column[:rows] for column in columns]
+    looped = np.array([scalar(*(float(column[i]) for column in columns))
+                       for i in range(len(columns[0]))], dtype=float)
+    batched = np.asarray(batch(*columns), dtype=float)
+    scale = np.maximum(np.abs(looped), 1.0)
+    return float(np.max(np.abs(looped - batched) / scale))
+
+
+def run_benchmarks(max_size, seed=0):
+    """Run every case and return the results dictionary."""
+    rng = np.random.default_rng(seed)
+    sizes = [10 ** exponent for exponent in range(0, len(str(max_size)))
+             if 10 ** exponent <= max_size]
+    inputs = _random_inputs(rng, max_size)
+
+    results = {}
+    for name, (scalar, batch, fields) in CASES.items():
+        columns = [inputs[field] for field in fields]
+        first_row = [float(column[0]) for column in columns]
+        results[name] = {
+            "scalar_ns": scalar_overhead_ns(scalar, first_row),
+            "batch_rows_per_sec": {
+                str(size): batch_rows_per_second(batch, [column[:size] for column in columns])
+                for size in sizes
+            },
+            "max_relative_difference": check_equivalence(scalar, batch, columns),
+        }
+        print_case(name, results[name])
+    return results
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+
+def print_case(name, result):
+    print(f"\n{name}")
+    print(f"  scalar: {result['scalar_ns']:,.0f} ns/call")
+    for size, rate in result["batch_rows_per_sec"].items():
+        print(f"  batch {int(size):>10,} rows: {rate:>16,.0f} rows/sec")
+    print(f"  max relative difference: {result['max_relative_difference']:.2e}")
+
+
+def compare(results, baseline, tolerance):
+    """Print slowdowns against a baseline and return the list of regressions."""
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        ratio = result["scalar_ns"] / old["scalar_ns"]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name} scalar: {ratio:.2f}x slower")
+        for size, rate in result["batch_rows_per_sec"].items():
+            old_rate = old["batch_rows_per_sec"].get(size)
+            if old_rate and old_rate / rate > 1 + tolerance:
+                regressions.append(f"{name} batch {size}: {old_rate / rate:.2f}x slower")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the financial calculations.")
+    parser.add_argument("--max-size", type=int, default=10 ** 6,
+                        help="Largest batch size (powers of ten up to 10^7).")
+    parser.add_argument("--save", metavar="FILE", help="Write results as a JSON baseline.")
+    parser.add_argument("--compare", metavar="FILE", help="Compare against a JSON baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed slowdown fraction before failing (default 0.2).")
+    parser.add_argument("--equivalence", type=float, default=1e-9,
+                        help="Allowed relative scalar/batch difference (default 1e-9).")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.max_size)
+    failures = [f"{name}: scalar and batch differ by {result['max_relative_difference']:.2e}"
+                for name, result in results.items()
+                if result["max_relative_difference"] > args.equivalence]
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump({
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.machine(),
+                "results": results,
+            }, fh, indent=2)
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            failures += compare(results, json.load(fh)["results"], args.tolerance)
+
+    print()
+    if failures:
+        print("FAILED:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("All benchmarks passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Compound Returns
+Money-weighted returns (XIRR) and compounded APY, alongside the simple
+interest APR functions in financial_calculator.py.
+
+All rates use the same 365-day year and are returned in percent, like
+calculate_apr_from_profit(). Cash flows follow the usual sign convention:
+money invested is negative, money returned is positive, and `days` counts
+days since the first cash flow.
+
+calculate_xirr() solves one series in pure Python; calculate_xirr_batch()
+solves many series at once with vectorized Newton iterations, falling back
+to bisection inside a sign-change bracket wherever a Newton step would
+leave it. Run this file to benchmark the two.
+"""
+
+import math
+import random
+import time
+
+# The 365-day year is shared with the APR functions through financial_kernel.py
+from financial_kernel import DAYS_PER_YEAR
+
+LOWEST_RATE = -0.9999       # search floor for the annual rate (-99.99%)
+HIGHEST_RATE = 1e6          # search ceiling when expanding the bracket
+TOLERANCE = 1e-10
+MAX_ITERATIONS = 100
+
+
+# =============================================================================
+# COMPOUNDED APY FUNCTIONS
+# =============================================================================
+
+def calculate_apy_from_apr(apr, compounds_per_year=DAYS_PER_YEAR):
+    """
+    Calculate compounded annual yield from a simple-interest APR.
+    Formula: APY = ((1 + apr / 100 / n) ** n - 1) * 100
+    """
+    return ((1 + apr / 100 / compounds_per_year) ** compounds_per_year - 1) * 100
+
+
+def calculate_apy_from_profit(principal, days, profit):
+    """
+    Calculate compounded annual yield from principal, days, and profit.
+    Formula: APY = ((1 + profit / principal) ** (365 / days) - 1) * 100
+    """
+    return ((1 + profit / principal) ** (DAYS_PER_YEAR / days) - 1) * 100
+
+
+# =============================================================================
+# XIRR FUNCTIONS
+# =============================================================================
+
+def _npv(rate, amounts, years):
+    """Net present value and its derivative with respect to the rate."""
+    value = derivative = 0.0
+    base = 1 + rate
+    for amount, year in zip(amounts, years):
+        discounted = amount * base ** -year
+        value += discounted
+        derivative -= year * discounted / base
+    return value, derivative
+
+
+def calculate_xirr(amounts, days, guess=0.1):
+    """
+    Calculate the money-weighted annual return (XIRR) of one cash-flow series.
+
+    Returns the rate in percent, or NaN when the flows never change sign
+    inside the search range.
+    """
+    years = [day / DAYS_PER_YEAR for day in days]
+
+    low, high = LOWEST_RATE, 1.0
+    value_low = _npv(low, amounts, years)[0]
+    value_high = _npv(high, amounts, years)[0]
+    while (value_low > 0) == (value_high > 0):
+        if high >= HIGHEST_RATE:
+            return math.nan
+        low, value_low = high, value_high
+        high *= 2
+        value_high = _npv(high, amounts, years)[0]
+
+    rate = guess if low < guess < high else (low + high) / 2
+    for _ in range(MAX_ITERATIONS):
+        value, derivative = _npv(rate, amounts, years)
+        if abs(value) < TOLERANCE or high - low < TOLERANCE:
+            break
+
+        # Shrink the bracket around the root
+        if (value > 0) == (value_low > 0):
+            low, value_low = rate, value
+        else:
+            high = rate
+
+        step = rate - value / derivative if derivative else math.nan
+        rate = step if low < step < high else (low + high) / 2
+
+    return rate * 100
+
+
+def pad_cash_flows(series):
+    """
+    Pack a list of (amounts, days) series into two 2-D arrays.
+
+    Short series are padded with zero amounts at day 0, which add nothing
+    to the present value.
+    """
+    import numpy as np
+
+    width = max(len(amounts) for amounts, _ in series)
+    amounts = np.zeros((len(series), width))
+    days = np.zeros((len(series), width))
+    for row, (series_amounts, series_days) in enumerate(series):
+        amounts[row, :len(series_amounts)] = series_amounts
+        days[row, :len(series_days)] = series_days
+    return amounts, days
+
+
+def _npv_batch(np, rate, amounts, years):
+    """Row-wise net present value and derivative for a column of rates."""
+    base = 1 + rate[:, None]
+    discounted = amounts * base ** -years
+    return discounted.sum(axis=1), -(years * discounted).sum(axis=1) / base[:, 0]
+
+
+def calculate_xirr_batch(amounts, days, guess=0.1):
+    """
+    Calculate XIRR for many cash-flow series at once.
+
+    `amounts` and `days` are 2-D arrays with one series per row (see
+    pad_cash_flows()). Every row runs the same safeguarded Newton method as
+    calculate_xirr(), but each iteration is a handful of whole-array
+    operations. Returns a 1-D array of rates in percent (NaN where no root
+    was bracketed).
+    """
+    import numpy as np
+
+    amounts = np.asarray(amounts, dtype=float)
+    years = np.asarray(days, dtype=float) / DAYS_PER_YEAR
+    size = amounts.shape[0]
+
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        # Bracket a sign change for every row by doubling the upper bound
+        low = np.full(size, LOWEST_RATE)
+        high = np.ones(size)
+        value_low = _npv_batch(np, low, amounts, years)[0]
+        value_high = _npv_batch(np, high, amounts, years)[0]
+        unbracketed = (value_low > 0) == (value_high > 0)
+        # Like calculate_xirr(), a row stops expanding once high reaches the cap
+        expanding = unbracketed & (high < HIGHEST_RATE)
+        while expanding.any():
+            low[expanding] = high[expanding]
+            value_low[expanding] = value_high[expanding]
+            high[expanding] *= 2
+            value_high[expanding] = _npv_batch(
+                np, high[expanding], amounts[expanding], years[expanding])[0]
+            unbracketed = (value_low > 0) == (value_high > 0)
+            expanding = unbracketed & (high < HIGHEST_RATE)
+
+        rate = np.where((low < guess) & (guess < high), guess, (low + high) / 2)
+        active = ~unbracketed
+        for _ in range(MAX_ITERATIONS):
+            if not active.any():
+                break
+            rows = np.flatnonzero(active)
+            value, derivative = _npv_batch(np, rate[rows], amounts[rows], years[rows])
+
+            done = (np.abs(value) < TOLERANCE) | (high[rows] - low[rows] < TOLERANCE)
+            active[rows[done]] = False
+            keep = ~done
+            rows, value, derivative = rows[keep], value[keep], derivative[keep]
+
+            # Shrink each bracket around its root
+            same_side = (value > 0) == (value_low[rows] > 0)
+            low[rows] = np.where(same_side, rate[rows], low[rows])
+            value_low[rows] = np.where(same_side, value, value_low[rows])
+            high[rows] = np.where(same_side, high[rows], rate[rows])
+
+            step = rate[rows] - value / derivative
+            inside = (low[rows] < step) & (step < high[rows])
+            rate[rows] = np.where(inside, step, (low[rows] + high[rows]) / 2)
+
+    rate[unbracketed] = np.nan
+    return rate * 100
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def _random_series(rng, flows):
+    """One investment followed by irregular positive or negative cash flows."""
+    days = sorted(rng.sample(range(1, 5 * DAYS_PER_YEAR), flows - 1))
+    amounts = [-10000.0] + [rng.uniform(-500, 3000) for _ in days]
+    return amounts, [0] + days
+
+
+def main():
+    """Compare calculate_xirr in a loop against calculate_xirr_batch."""
+    rng = random.Random(42)
+    series = [_random_series(rng, rng.randint(2, 24)) for _ in range(20000)]
+
+    start = time.perf_counter()
+    looped = [calculate_xirr(amounts, days) for amounts, days in series]
+    loop_seconds = time.perf_counter() - start
+
+    amounts, days = pad_cash_flows(series)
+    start = time.perf_counter()
+    batched = calculate_xirr_batch(amounts, days)
+    batch_seconds = time.perf_counter() - start
+
+    max_difference = max(
+        (abs(a - b) for a, b in zip(looped, batched) if not math.isnan(a)), default=0.0)
+    print(f"Series: {len(series)}")
+    print(f"Per-series loop: {loop_seconds:.3f} s")
+    print(f"Batch solver:    {batch_seconds:.3f} s ({loop_seconds / batch_seconds:.1f}x)")
+    print(f"Max difference:  {max_difference:.2e} percentage points")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Fee Schedules
+Broker / exchange fee schedules with tiered commissions and effective dates,
+compiled into sorted lookup arrays for calculate_trading_costs.
+
+Config file format (JSON):
+
+    {
+      "schedules": [
+        {
+          "broker": "default",
+          "exchange": "SH",
+          "effective_from": "2023-08-28",
+          "transfer_fee_rate": 0.00001,
+          "stamp_duty_rate": 0.0005,
+          "min_commission": 5,
+          "commission_tiers": [
+            {"min_value": 0, "rate": 0.0003},
+            {"min_value": 1000000, "rate": 0.00025}
+          ]
+        }
+      ]
+    }
+
+Each schedule applies from its effective date until the next schedule for
+the same (broker, exchange) pair. Commission tiers are selected by the
+trade value of each side (price * share volume). Omitted fields fall back
+to the constants in financial_calculator.py.
+"""
+
+import json
+import os
+from bisect import bisect_right
+from datetime import date
+
+from financial_calculator import (
+    COMMISSION_RATE,
+    MIN_COMMISSION,
+    STAMP_DUTY_RATE,
+    TRANSFER_FEE_RATE,
+    calculate_trading_costs,
+    calculate_trading_costs_batch,
+)
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+DEFAULT_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fee_schedules.json")
+
+
+# =============================================================================
+# SCHEDULE OBJECTS
+# =============================================================================
+
+def _to_epoch_day(value):
+    """Convert an ISO date string or datetime.date into days since 1970-01-01."""
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    return value.toordinal() - EPOCH_ORDINAL
+
+
+class FeeSchedule:
+    """
+    A single fee schedule: tiered commission plus flat-rate fees.
+
+    Tier thresholds are kept as a sorted list so the commission rate for a
+    trade value is found with one bisect.
+    """
+
+    def __init__(self, commission_tiers=None, transfer_fee_rate=TRANSFER_FEE_RATE,
+                 stamp_duty_rate=STAMP_DUTY_RATE, min_commission=MIN_COMMISSION):
+        tiers = sorted(
+            (float(tier["min_value"]), float(tier["rate"]))
+            for tier in (commission_tiers or [{"min_value": 0, "rate": COMMISSION_RATE}])
+        )
+        if tiers[0][0] > 0:
+            raise ValueError("The first commission tier must start at trade value 0")
+
+        self.tier_thresholds = [threshold for threshold, _ in tiers]
+        self.tier_rates = [rate for _, rate in tiers]
+        self.transfer_fee_rate = transfer_fee_rate
+        self.stamp_duty_rate = stamp_duty_rate
+        self.min_commission = min_commission
+
+    def commission_rate(self, trade_value):
+        """Return the commission rate for a trade of the given value."""
+        return self.tier_rates[bisect_right(self.tier_thresholds, trade_value) - 1]
+
+    def __repr__(self):
+        return (f"FeeSchedule(tiers={list(zip(self.tier_thresholds, self.tier_rates))}, "
+                f"transfer_fee_rate={self.transfer_fee_rate}, "
+                f"stamp_duty_rate={self.stamp_duty_rate}, "
+                f"min_commission={self.min_commission})")
+
+
+class FeeScheduleTable:
+    """
+    All schedules, indexed by (broker, exchange) and effective date.
+
+    For each (broker, exchange) pair the effective dates are stored as a
+    sorted list of epoch days alongside the matching schedules, so resolving
+    a trade date is a single bisect.
+    """
+
+    def __init__(self, entries):
+        grouped = {}
+        for entry in entries:
+            key = (entry["broker"], entry["exchange"])
+            schedule = FeeSchedule(
+                commission_tiers=entry.get("commission_tiers"),
+                transfer_fee_rate=entry.get("transfer_fee_rate", TRANSFER_FEE_RATE),
+                stamp_duty_rate=entry.get("stamp_duty_rate", STAMP_DUTY_RATE),
+                min_commission=entry.get("min_commission", MIN_COMMISSION),
+            )
+            grouped.setdefault(key, []).append(
+                (_to_epoch_day(entry["effective_from"]), schedule))
+
+        self._dates = {}
+        self._schedules = {}
+        for key, items in grouped.items():
+            items.sort(key=lambda item: item[0])
+            self._dates[key] = [day for day, _ in items]
+            self._schedules[key] = [schedule for _, schedule in items]
+
+    def keys(self):
+        """Return the known (broker, exchange) pairs."""
+        return list(self._dates)
+
+    def resolve(self, broker, exchange, trade_date):
+        """Return the FeeSchedule in force for a trade on `trade_date`."""
+        key = (broker, exchange)
+        if key not in self._dates:
+            raise KeyError(f"No fee schedule for broker={broker!r}, exchange={exchange!r}")
+
+        position = bisect_right(self._dates[key], _to_epoch_day(trade_date)) - 1
+        if position < 0:
+            raise ValueError(f"No fee schedule for {key} in force on {trade_date}")
+        return self._schedules[key][position]
+
+    def resolve_batch(self, brokers, exchanges, trade_dates, buy_values, sell_values):
+        """
+        Resolve rates for arrays of trades at once.
+
+        Rows are grouped by (broker, exchange) and each group's dates and
+        tier thresholds are looked up with np.searchsorted, so the Python
+        loop runs once per distinct schedule rather than once per trade.
+
+        Returns a dictionary of rate arrays accepted by
+        calculate_trading_costs_batch().
+        """
+        import numpy as np
+
+        brokers = np.asarray(brokers)
+        exchanges = np.asarray(exchanges)
+        days = np.asarray(trade_dates, dtype="datetime64[D]").astype(np.int64)
+        buy_values = np.asarray(buy_values, dtype=float)
+        sell_values = np.asarray(sell_values, dtype=float)
+        size = days.shape[0]
+
+        rates = {
+            "commission_rate_buy": np.empty(size),
+            "commission_rate_sell": np.empty(size),
+            "transfer_fee_rate": np.empty(size),
+            "stamp_duty_rate": np.empty(size),
+            "min_commission": np.empty(size),
+        }
+
+        broker_names, broker_ids = np.unique(brokers, return_inverse=True)
+        exchange_names, exchange_ids = np.unique(exchanges, return_inverse=True)
+        pairs, pair_ids = np.unique(
+            broker_ids * len(exchange_names) + exchange_ids, return_inverse=True)
+
+        for pair_id, pair in enumerate(pairs):
+            key = (str(broker_names[pair // len(exchange_names)]),
+                   str(exchange_names[pair % len(exchange_names)]))
+            if key not in self._dates:
+                raise KeyError(f"No fee schedule for broker={key[0]!r}, exchange={key[1]!r}")
+
+            rows = np.flatnonzero(pair_ids == pair_id)
+            positions = np.searchsorted(self._dates[key], days[rows], side="right") - 1
+            if (positions < 0).any():
+                raise ValueError(f"No fee schedule for {key} in force on some trade dates")
+
+            for position in np.unique(positions):
+                schedule = self._schedules[key][position]
+                group = rows[positions == position]
+                thresholds = np.asarray(schedule.tier_thresholds)
+                tier_rates = np.asarray(schedule.tier_rates)
+
+                buy_tier = np.searchsorted(thresholds, buy_values[group], side="right") - 1
+                sell_tier = np.searchsorted(thresholds, sell_values[group], side="right") - 1
+                rates["commission_rate_buy"][group] = tier_rates[buy_tier]
+                rates["commission_rate_sell"][group] = tier_rates[sell_tier]
+                rates["transfer_fee_rate"][group] = schedule.transfer_fee_rate
+                rates["stamp_duty_rate"][group] = schedule.stamp_duty_rate
+                rates["min_commission"][group] = schedule.min_commission
+
+        return rates
+
+
+def load_fee_schedules(path):
+    """Load a JSON fee schedule config file into a FeeScheduleTable."""
+    with open(path, encoding="utf-8") as fh:
+        config = json.load(fh)
+    return FeeScheduleTable(config["schedules"])
+
+
+# =============================================================================
+# SCHEDULE-AWARE COST FUNCTIONS
+# =============================================================================
+
+def calculate_scheduled_trading_costs(table, broker, exchange, trade_date,
+                                      buy_price, sell_price, share_volume):
+    """Calculate round-trip trading costs using the schedule in force on `trade_date`."""
+    schedule = table.resolve(broker, exchange, trade_date)
+    return calculate_trading_costs(buy_price, sell_price, share_volume, schedule)
+
+
+def calculate_scheduled_trading_costs_batch(table, brokers, exchanges, trade_dates,
+                                            buy_prices, sell_prices, share_volumes):
+    """Vectorized calculate_scheduled_trading_costs over arrays of trades."""
+    import numpy as np
+
+    buy_values = np.asarray(buy_prices, dtype=float) * share_volumes
+    sell_values = np.asarray(sell_prices, dtype=float) * share_volumes
+    rates = table.resolve_batch(brokers, exchanges, trade_dates, buy_values, sell_values)
+    return calculate_trading_costs_batch(buy_prices, sell_prices, share_volumes, rates)
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+def main():
+    """Price one trade on the sample schedules before and after rate changes."""
+    table = load_fee_schedules(DEFAULT_CONFIG)
+
+    for trade_date in ("2020-06-01", "2022-06-01", "2024-01-02"):
+        costs = calculate_scheduled_trading_costs(
+            table, "default", "SH", trade_date, 10.0, 10.5, 10000)
+        print(f"{trade_date}  SH  Total Trading Cost: {costs['total_cost']:.2f} CNY")
+
+
+if __name__ == "__main__":
+    main()
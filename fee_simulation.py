@@ -0,0 +1,162 @@
+"""
+Fee Drag Simulator
+Monte Carlo estimate of how commission (with MIN_COMMISSION), stamp duty
+and transfer fees erode returns for different trade sizes and holding
+periods.
+
+Each simulated path is a geometric Brownian motion of daily prices. The
+strategy buys a fixed share volume, holds it for `holding_days`, sells,
+and immediately buys again, starting from a random day in the first
+holding period. Fees for every round trip come from
+calculate_trading_costs_batch(), so the fee rules match
+calculate_trading_costs() exactly.
+
+Paths are generated in vectorized batches. Each batch gets its own child
+of one np.random.SeedSequence, so results are reproducible for a given
+seed no matter how many worker processes share the batches.
+
+Usage:
+  python fee_simulation.py --paths 1000000 --processes 8
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from financial_calculator import calculate_trading_costs_batch
+
+TRADING_DAYS_PER_YEAR = 250
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+# =============================================================================
+# SIMULATION
+# =============================================================================
+
+def simulate_batch(seed, paths, share_volume, holding_days, horizon_days=TRADING_DAYS_PER_YEAR,
+                   start_price=10.0, annual_drift=0.05, annual_volatility=0.3):
+    """
+    Simulate one batch of price paths and round trips.
+
+    Returns (gross_profit, net_profit) arrays with one entry per path.
+    """
+    if not 1 <= holding_days <= horizon_days:
+        raise ValueError("holding_days must be between 1 and horizon_days")
+
+    rng = np.random.default_rng(seed)
+    daily_drift = (annual_drift - annual_volatility ** 2 / 2) / TRADING_DAYS_PER_YEAR
+    daily_volatility = annual_volatility / np.sqrt(TRADING_DAYS_PER_YEAR)
+
+    log_returns = rng.normal(daily_drift, daily_volatility, size=(paths, horizon_days))
+    prices = np.empty((paths, horizon_days + 1))
+    prices[:, 0] = start_price
+    prices[:, 1:] = start_price * np.exp(np.cumsum(log_returns, axis=1))
+    prices = np.round(prices, 2)  # quoted prices tick in 0.01 CNY
+
+    # Back-to-back round trips from a random start day in the first period
+    offsets = rng.integers(0, holding_days, size=(paths, 1))
+    trips = (horizon_days - holding_days) // holding_days + 1
+    buy_days = offsets + holding_days * np.arange(trips)
+    sell_days = buy_days + holding_days
+    valid = sell_days <= horizon_days
+    buy_days = np.minimum(buy_days, horizon_days)
+    sell_days = np.minimum(sell_days, horizon_days)
+
+    buy_prices = np.take_along_axis(prices, buy_days, axis=1)
+    sell_prices = np.take_along_axis(prices, sell_days, axis=1)
+    costs = calculate_trading_costs_batch(buy_prices, sell_prices, share_volume)
+
+    gross_profit = np.where(valid, (sell_prices - buy_prices) * share_volume, 0.0).sum(axis=1)
+    total_cost = np.where(valid, costs["total_cost"], 0.0).sum(axis=1)
+    return gross_profit, gross_profit - total_cost
+
+
+def _simulate_batch_args(args):
+    """Unpack arguments for ProcessPoolExecutor.map()."""
+    return simulate_batch(*args)
+
+
+def run_simulation(paths, share_volume, holding_days, batch_size=10000, processes=None,
+                   seed=0, **path_options):
+    """
+    Simulate `paths` price paths split into batches across processes.
+
+    Returns a dictionary of per-path "gross_profit" and "net_profit"
+    arrays, concatenated in batch order. `path_options` are passed on to
+    simulate_batch() (horizon_days, start_price, annual_drift,
+    annual_volatility).
+    """
+    sizes = [batch_size] * (paths // batch_size)
+    if paths % batch_size:
+        sizes.append(paths % batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    jobs = [
+        (batch_seed, size, share_volume, holding_days,
+         path_options.get("horizon_days", TRADING_DAYS_PER_YEAR),
+         path_options.get("start_price", 10.0),
+         path_options.get("annual_drift", 0.05),
+         path_options.get("annual_volatility", 0.3))
+        for batch_seed, size in zip(seeds, sizes)
+    ]
+
+    if processes == 1:
+        results = [_simulate_batch_args(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(_simulate_batch_args, jobs))
+
+    return {
+        "gross_profit": np.concatenate([gross for gross, _ in results]),
+        "net_profit": np.concatenate([net for _, net in results]),
+    }
+
+
+def summarize(results):
+    """Return mean and percentiles of gross profit, net profit and fee drag."""
+    gross = results["gross_profit"]
+    net = results["net_profit"]
+    summary = {}
+    for name, values in (("gross_profit", gross), ("net_profit", net),
+                         ("fee_drag", gross - net)):
+        summary[name] = {"mean": float(values.mean())}
+        for pct, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+            summary[name][f"p{pct}"] = float(value)
+    return summary
+
+
+# =============================================================================
+# MAIN PROGRAM
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo fee drag simulator.")
+    parser.add_argument("--paths", type=int, default=100000, help="Paths per scenario.")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Paths per batch.")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="Worker processes (default: one per CPU).")
+    parser.add_argument("--seed", type=int, default=0, help="Root random seed.")
+    parser.add_argument("--volumes", type=int, nargs="+", default=[100, 1000, 10000],
+                        help="Share volumes per trade.")
+    parser.add_argument("--holding-days", type=int, nargs="+", default=[1, 5, 20, 60],
+                        help="Holding periods in trading days.")
+    args = parser.parse_args()
+
+    print(f"{'Volume':>8} {'Hold':>5} {'Gross (mean)':>14} {'Net (mean)':>12} "
+          f"{'Fees p5':>10} {'Fees p50':>10} {'Fees p95':>10}")
+    for share_volume in args.volumes:
+        for holding_days in args.holding_days:
+            results = run_simulation(args.paths, share_volume, holding_days,
+                                     batch_size=args.batch_size, processes=args.processes,
+                                     seed=args.seed)
+            summary = summarize(results)
+            fees = summary["fee_drag"]
+            print(f"{share_volume:>8} {holding_days:>5} "
+                  f"{summary['gross_profit']['mean']:>14.2f} "
+                  f"{summary['net_profit']['mean']:>12.2f} "
+                  f"{fees['p5']:>10.2f} {fees['p50']:>10.2f} {fees['p95']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,31 @@
 """
 Financial Calculator
 Stock commission calculation, golden ratio analysis, and APR calculations.
+
+Usage:
+  python financial_calculator.py          # interactive menu
+  python financial_calculator.py --json   # JSON-Lines requests on stdin
 """
 
+import sys
+
+import financial_kernel as kernel
+
 # =============================================================================
 # CONSTANTS - Chinese Stock Market Rates
 # =============================================================================
 
-COMMISSION_RATE = 0.0003      # Brokerage commission rate (varies by broker)
-TRANSFER_FEE_RATE = 0.00002   # Transfer fee rate (set by government)
-STAMP_DUTY_RATE = 0.001       # Stamp duty rate (only on sell, set by government)
-MIN_COMMISSION = 5            # Minimum commission per transaction (CNY)
+# Market rates and golden ratio levels are shared with PY3_RichTreasure.py
+# through financial_kernel.py
+from financial_kernel import (
+    COMMISSION_RATE,
+    GOLDEN_RATIOS,
+    MIN_COMMISSION,
+    STAMP_DUTY_RATE,
+    TRANSFER_FEE_RATE,
+)
 
-# Golden ratio levels (based on Fibonacci ratios)
-GOLDEN_RATIOS = [
-    (0.191, 1.191, "Level 1"),
-    (0.236, 1.236, "Level 2"),
-    (0.382, 1.382, "Level 3"),
-    (0.500, 1.500, "Level 4"),
-    (0.618, 1.618, "Level 5"),
-    (0.764, 1.764, "Level 6"),
-    (0.809, 1.809, "Level 7"),
-]
+BOARD_LOT = 100               # Shares per board lot (orders trade in whole lots)
 
 
 # =============================================================================
@@ -30,16 +34,16 @@ GOLDEN_RATIOS = [
 
 def calculate_gross_profit(sell_price, buy_price, share_volume):
     """Calculate gross profit from stock trade."""
-    return sell_price * share_volume - buy_price * share_volume
+    return kernel.gross_profit(sell_price, buy_price, share_volume)
 
 
-def calculate_commission(price, share_volume, commission_rate=COMMISSION_RATE):
+def calculate_commission(price, share_volume, commission_rate=COMMISSION_RATE,
+                         min_commission=MIN_COMMISSION):
     """
     Calculate brokerage commission with minimum threshold.
     Chinese stock market rule: minimum commission is 5 CNY.
     """
-    calculated = price * share_volume * commission_rate
-    return max(calculated, MIN_COMMISSION)
+    return kernel.commission(price, share_volume, commission_rate, min_commission)
 
 
 def calculate_stamp_duty(sell_price, share_volume, stamp_duty_rate=STAMP_DUTY_RATE):
@@ -47,43 +51,160 @@ def calculate_stamp_duty(sell_price, share_volume, stamp_duty_rate=STAMP_DUTY_RA
     Calculate stamp duty (only applied on sell transactions).
     Chinese stock market rule: stamp duty only charged when selling.
     """
-    return sell_price * share_volume * stamp_duty_rate
+    return kernel.stamp_duty(sell_price, share_volume, stamp_duty_rate)
 
 
 def calculate_transfer_fee(price, share_volume, transfer_fee_rate=TRANSFER_FEE_RATE):
     """Calculate transfer fee for a transaction."""
-    return price * share_volume * transfer_fee_rate
+    return kernel.transfer_fee(price, share_volume, transfer_fee_rate)
 
 
-def calculate_trading_costs(buy_price, sell_price, share_volume):
+def calculate_trading_costs(buy_price, sell_price, share_volume, schedule=None):
     """
     Calculate all trading costs for a round-trip trade.
     Returns a dictionary with detailed breakdown.
+
+    If a fee schedule (see fee_schedule.py) is given, its tiered commission
+    rate, transfer fee, stamp duty and minimum commission replace the
+    module constants.
+    """
+    if schedule is None:
+        return kernel.trading_costs(buy_price, sell_price, share_volume)
+
+    return kernel.trading_costs(
+        buy_price, sell_price, share_volume,
+        commission_rate_buy=schedule.commission_rate(buy_price * share_volume),
+        commission_rate_sell=schedule.commission_rate(sell_price * share_volume),
+        transfer_fee_rate=schedule.transfer_fee_rate,
+        stamp_duty_rate=schedule.stamp_duty_rate,
+        min_commission=schedule.min_commission,
+    )
+
+
+def calculate_trading_costs_batch(buy_prices, sell_prices, share_volumes, rates=None):
+    """
+    Vectorized calculate_trading_costs over arrays of round-trip trades.
+
+    `rates` is an optional dictionary of per-trade rate arrays (or scalars)
+    as returned by FeeScheduleTable.resolve_batch(); missing entries fall
+    back to the module constants. Returns the same keys as
+    calculate_trading_costs, each holding a NumPy array.
+    """
+    import numpy as np
+
+    rates = rates or {}
+    return kernel.trading_costs(
+        np.asarray(buy_prices, dtype=float),
+        np.asarray(sell_prices, dtype=float),
+        np.asarray(share_volumes, dtype=float),
+        commission_rate_buy=rates.get("commission_rate_buy", COMMISSION_RATE),
+        commission_rate_sell=rates.get("commission_rate_sell", COMMISSION_RATE),
+        transfer_fee_rate=rates.get("transfer_fee_rate", TRANSFER_FEE_RATE),
+        stamp_duty_rate=rates.get("stamp_duty_rate", STAMP_DUTY_RATE),
+        min_commission=rates.get("min_commission", MIN_COMMISSION),
+    )
+
+
+# =============================================================================
+# BREAK-EVEN FUNCTIONS
+# =============================================================================
+
+def calculate_break_even_sell_price(buy_price, share_volume, target_net_profit=0):
+    """
+    Calculate the sell price at which net profit equals target_net_profit.
+
+    Net profit is increasing in the sell price and piecewise linear: the
+    sell commission is either the MIN_COMMISSION floor or price * volume *
+    COMMISSION_RATE. Both linear pieces are solved in closed form and the
+    floor piece is kept where its solution really is below the threshold.
+
+    Accepts scalars or arrays (broadcast together) and returns a float or
+    a NumPy array of exact sell prices.
     """
-    # Buy side costs
-    commission_buy = calculate_commission(buy_price, share_volume)
-    transfer_fee_buy = calculate_transfer_fee(buy_price, share_volume)
-    cost_buy = commission_buy + transfer_fee_buy
-
-    # Sell side costs (includes stamp duty)
-    commission_sell = calculate_commission(sell_price, share_volume)
-    transfer_fee_sell = calculate_transfer_fee(sell_price, share_volume)
-    stamp_duty = calculate_stamp_duty(sell_price, share_volume)
-    cost_sell = commission_sell + transfer_fee_sell + stamp_duty
-
-    # Total costs
-    total_cost = cost_buy + cost_sell
-
-    return {
-        "commission_buy": commission_buy,
-        "commission_sell": commission_sell,
-        "transfer_fee_buy": transfer_fee_buy,
-        "transfer_fee_sell": transfer_fee_sell,
-        "stamp_duty": stamp_duty,
-        "cost_buy": cost_buy,
-        "cost_sell": cost_sell,
-        "total_cost": total_cost,
+    import numpy as np
+
+    buy_price = np.asarray(buy_price, dtype=float)
+    share_volume = np.asarray(share_volume, dtype=float)
+
+    buy_value = buy_price * share_volume
+    cost_buy = (np.maximum(buy_value * COMMISSION_RATE, MIN_COMMISSION)
+                + buy_value * TRANSFER_FEE_RATE)
+    required = target_net_profit + buy_value + cost_buy
+
+    # Sell commission at the floor: sell_value * (1 - t - d) = required + M
+    floor_price = (required + MIN_COMMISSION) / (
+        share_volume * (1 - TRANSFER_FEE_RATE - STAMP_DUTY_RATE))
+    # Sell commission proportional: sell_value * (1 - c - t - d) = required
+    rate_price = required / (
+        share_volume * (1 - COMMISSION_RATE - TRANSFER_FEE_RATE - STAMP_DUTY_RATE))
+
+    on_floor = floor_price * share_volume * COMMISSION_RATE <= MIN_COMMISSION
+    result = np.where(on_floor, floor_price, rate_price)
+    return result if result.ndim else float(result)
+
+
+# =============================================================================
+# ORDER SIZING FUNCTIONS
+# =============================================================================
+
+def calculate_optimal_order_size(price, budget, target_rate=COMMISSION_RATE):
+    """
+    Calculate board-lot order sizes around the MIN_COMMISSION threshold.
+
+    The effective commission rate of an order is max(COMMISSION_RATE,
+    MIN_COMMISSION / order_value), so it falls as the order grows until the
+    floor stops binding. Everything is solved in closed form:
+
+    - threshold_lots: fewest lots whose effective rate is <= target_rate
+      (targets below COMMISSION_RATE are treated as COMMISSION_RATE, the
+      best rate achievable)
+    - affordable_lots: most lots whose price plus buy-side fees fit in budget
+    - lots: threshold_lots if affordable, otherwise affordable_lots (the
+      lowest effective rate the budget allows)
+    - meets_target: whether lots reaches the target rate
+    - effective_commission_rate: commission / order value at lots (NaN at 0)
+
+    Accepts scalars or arrays (broadcast together); returns a dictionary of
+    scalars or NumPy arrays. Raises ValueError unless every price is
+    positive.
+    """
+    import numpy as np
+
+    price = np.asarray(price, dtype=float)
+    if not np.all(price > 0):
+        raise ValueError("price must be positive")
+    budget = np.asarray(budget, dtype=float)
+    target_rate = np.maximum(np.asarray(target_rate, dtype=float), COMMISSION_RATE)
+
+    # Smallest lot count with lot_value * target_rate >= MIN_COMMISSION
+    lot_value = price * BOARD_LOT
+    threshold_lots = np.ceil(MIN_COMMISSION / (lot_value * target_rate))
+    threshold_lots -= (threshold_lots - 1) * lot_value * target_rate >= MIN_COMMISSION
+    threshold_lots = np.maximum(threshold_lots, 1)
+
+    # Buy cost is max(value * (1 + t) + M, value * (1 + c + t)); both must fit
+    max_value = np.minimum((budget - MIN_COMMISSION) / (1 + TRANSFER_FEE_RATE),
+                           budget / (1 + COMMISSION_RATE + TRANSFER_FEE_RATE))
+    affordable_lots = np.maximum(np.floor(max_value / lot_value), 0)
+
+    meets_target = affordable_lots >= threshold_lots
+    lots = np.where(meets_target, threshold_lots, affordable_lots)
+    order_value = lots * lot_value
+    with np.errstate(divide="ignore", invalid="ignore"):
+        effective_rate = np.where(
+            lots > 0, np.maximum(order_value * COMMISSION_RATE, MIN_COMMISSION) / order_value,
+            np.nan)
+
+    result = {
+        "lots": lots.astype(np.int64),
+        "threshold_lots": threshold_lots.astype(np.int64),
+        "affordable_lots": affordable_lots.astype(np.int64),
+        "meets_target": meets_target,
+        "effective_commission_rate": effective_rate,
     }
+    if lots.ndim == 0:
+        result = {key: value.item() for key, value in result.items()}
+    return result
 
 
 # =============================================================================
@@ -95,18 +216,20 @@ def calculate_golden_ratio_single(base_price):
     Calculate golden ratio levels from a single base price.
     Used for finding resistance (uptrend) and support (downtrend) levels.
     """
+    supports, resistances = kernel.golden_ratio_single(base_price)
     results = {"resistance": [], "support": []}
 
-    for down_ratio, up_ratio, level_name in GOLDEN_RATIOS:
+    for (down_ratio, up_ratio, level_name), support, resistance in zip(
+            GOLDEN_RATIOS, supports, resistances):
         results["resistance"].append({
             "level": level_name,
             "ratio": up_ratio,
-            "price": round(base_price * up_ratio, 2),
+            "price": round(resistance, 2),
         })
         results["support"].append({
             "level": level_name,
             "ratio": down_ratio,
-            "price": round(base_price * down_ratio, 2),
+            "price": round(support, 2),
         })
 
     return results
@@ -117,12 +240,11 @@ def calculate_golden_ratio_dual(high_point, low_point):
     Calculate golden ratio levels from two base points (high and low).
     Calculates support and resistance based on the price range.
     """
-    price_range = high_point - low_point
+    supports, resistances = kernel.golden_ratio_dual(high_point, low_point)
     results = []
 
-    for down_ratio, up_ratio, level_name in GOLDEN_RATIOS:
-        support = high_point - price_range * down_ratio
-        resistance = support + price_range * up_ratio
+    for (down_ratio, up_ratio, level_name), support, resistance in zip(
+            GOLDEN_RATIOS, supports, resistances):
         results.append({
             "level": level_name,
             "down_ratio": down_ratio,
@@ -143,7 +265,7 @@ def calculate_apr_from_profit(principal, days, profit):
     Calculate annual percentage rate from principal, days, and profit.
     Formula: APR = (profit / days * 365 / principal) * 100
     """
-    return (profit / days * 365 / principal) * 100
+    return kernel.apr_from_profit(principal, days, profit)
 
 
 def calculate_profit_from_apr(principal, days, apr):
@@ -151,7 +273,7 @@ def calculate_profit_from_apr(principal, days, apr):
     Calculate profit from principal, days, and annual percentage rate.
     Formula: profit = principal * apr / 100 / 365 * days
     """
-    return principal * apr / 100 / 365 * days
+    return kernel.profit_from_apr(principal, days, apr)
 
 
 def calculate_daily_income(principal, apr):
@@ -159,7 +281,7 @@ def calculate_daily_income(principal, apr):
     Calculate daily income from principal and annual percentage rate.
     Formula: daily_income = principal * apr / 100 / 365
     """
-    return principal * apr / 100 / 365
+    return kernel.daily_income(principal, apr)
 
 
 def calculate_apr_from_daily_income(principal, daily_income):
@@ -167,7 +289,7 @@ def calculate_apr_from_daily_income(principal, daily_income):
     Calculate annual percentage rate from principal and daily income.
     Formula: APR = (daily_income * 365 / principal) * 100
     """
-    return (daily_income * 365 / principal) * 100
+    return kernel.apr_from_daily_income(principal, daily_income)
 
 
 # =============================================================================
@@ -338,12 +460,174 @@ def display_menu():
     print("=" * 50)
 
 
+# =============================================================================
+# JSON-LINES (HEADLESS) MODE
+# =============================================================================
+
+def json_commission_calculation(buy_price, sell_price, share_volume):
+    """Headless version of menu option 1."""
+    gross_profit = calculate_gross_profit(sell_price, buy_price, share_volume)
+    result = calculate_trading_costs(buy_price, sell_price, share_volume)
+    result["gross_profit"] = gross_profit
+    result["net_profit"] = gross_profit - result["total_cost"]
+    return result
+
+
+def json_apr_from_profit(principal, days, profit):
+    """Headless version of menu option 4."""
+    return {"apr": calculate_apr_from_profit(principal, days, profit)}
+
+
+def json_profit_from_apr(principal, days, apr):
+    """Headless version of menu option 5."""
+    return {"profit": calculate_profit_from_apr(principal, days, apr)}
+
+
+def json_apr_from_daily_fixed_principal(daily_income):
+    """Headless version of menu option 6."""
+    return {"apr": calculate_apr_from_daily_income(10000.00, daily_income)}
+
+
+def json_daily_income_from_apr(principal, apr):
+    """Headless version of menu option 7."""
+    return {"daily_income": calculate_daily_income(principal, apr)}
+
+
+def json_apr_from_daily_custom_principal(principal, daily_income):
+    """Headless version of menu option 8."""
+    return {"apr": calculate_apr_from_daily_income(principal, daily_income)}
+
+
+# Operation names match the menu handlers without their "handle_" prefix,
+# in menu order, so requests may also give the menu number.
+JSON_OPERATIONS = {
+    "commission_calculation": json_commission_calculation,
+    "golden_ratio_single": calculate_golden_ratio_single,
+    "golden_ratio_dual": calculate_golden_ratio_dual,
+    "apr_from_profit": json_apr_from_profit,
+    "profit_from_apr": json_profit_from_apr,
+    "apr_from_daily_fixed_principal": json_apr_from_daily_fixed_principal,
+    "daily_income_from_apr": json_daily_income_from_apr,
+    "apr_from_daily_custom_principal": json_apr_from_daily_custom_principal,
+}
+JSON_OPERATIONS.update(
+    {str(choice): operation for choice, operation in enumerate(JSON_OPERATIONS.values(), 1)})
+
+
+def handle_json_request(request):
+    """
+    Evaluate one request object and return the response object.
+
+    Request:  {"id": 1, "operation": "apr_from_profit",
+               "args": {"principal": 10000, "days": 30, "profit": 50}}
+    Response: {"id": 1, "result": {"apr": 6.083...}}
+           or {"id": 1, "error": "..."}
+    """
+    response = {"id": request.get("id")}
+    try:
+        operation = JSON_OPERATIONS[str(request["operation"])]
+    except KeyError as err:
+        response["error"] = f"Unknown operation or missing field: {err}"
+        return response
+
+    # A KeyError raised by the operation itself is an ordinary error
+    try:
+        response["result"] = operation(**request.get("args", {}))
+    except Exception as err:
+        response["error"] = f"{type(err).__name__}: {err}"
+    return response
+
+
+def _request_batches(input_stream):
+    """
+    Yield lists of request lines, one list per read from the input.
+
+    For a binary-backed stream such as sys.stdin, read1() returns whatever
+    is already buffered (waiting only when nothing is), so a batch holds
+    every complete line currently available. Other text streams yield one
+    line per batch.
+    """
+    raw = getattr(input_stream, "buffer", None)
+    if raw is None or not hasattr(raw, "read1"):
+        for line in input_stream:
+            yield [line]
+        return
+
+    import codecs
+
+    # Incremental, so a UTF-8 character split across two reads stays intact
+    decode = codecs.getincrementaldecoder("utf-8")(errors="replace").decode
+    pending = ""
+    while True:
+        chunk = raw.read1(1 << 16)
+        if not chunk:
+            break
+        lines = (pending + decode(chunk)).split("\n")
+        pending = lines.pop()
+        if lines:
+            yield lines
+    pending += decode(b"", final=True)
+    if pending:
+        yield [pending]
+
+
+def run_json_lines(input_stream, output_stream):
+    """
+    Serve JSON-Lines requests until the input stream closes.
+
+    Each input line is one request object and gets one response line.
+    Responses to all the requests read in one go are written together and
+    flushed once, when no further input is buffered, so a long-lived
+    caller can pipeline requests through a single process without paying
+    a write per request. Blank lines are ignored.
+    """
+    import json
+
+    # Reuse one decoder and encoder; json.loads/dumps would set them up per call
+    loads = json.JSONDecoder().decode
+    dumps = json.JSONEncoder().encode
+    write = output_stream.write
+    flush = output_stream.flush
+
+    for lines in _request_batches(input_stream):
+        responses = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                response = handle_json_request(loads(line))
+            except ValueError as err:
+                response = {"id": None, "error": f"Invalid JSON: {err}"}
+            except AttributeError:
+                response = {"id": None, "error": "Request must be a JSON object"}
+            responses.append(dumps(response))
+        if responses:
+            write("\n".join(responses) + "\n")
+            flush()
+
+
 # =============================================================================
 # MAIN PROGRAM
 # =============================================================================
 
+def build_parser():
+    """Command-line parser; argparse is only imported when this runs."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Financial calculator.")
+    parser.add_argument("--json", action="store_true",
+                        help="Read JSON-Lines requests from stdin instead of showing the menu.")
+    return parser
+
+
 def main():
     """Main program loop."""
+    args = build_parser().parse_args()
+
+    if args.json:
+        run_json_lines(sys.stdin, sys.stdout)
+        return
+
     menu_handlers = {
         1: handle_commission_calculation,
         2: handle_golden_ratio_single,
@@ -0,0 +1,239 @@
+"""
+Financial Kernel
+Shared calculation core behind financial_calculator.py and
+PY3_RichTreasure.py: trading fees, golden ratio levels and APR math.
+
+Every function accepts plain scalars or arrays. Scalars are computed with
+plain Python arithmetic, so importing this module never imports NumPy;
+lists, tuples and NumPy arrays are broadcast together with NumPy, which
+is imported on first use.
+"""
+
+# =============================================================================
+# CONSTANTS - Chinese Stock Market Rates
+# =============================================================================
+
+COMMISSION_RATE = 0.0003      # Brokerage commission rate (varies by broker)
+TRANSFER_FEE_RATE = 0.00002   # Transfer fee rate (set by government)
+STAMP_DUTY_RATE = 0.001       # Stamp duty rate (only on sell, set by government)
+MIN_COMMISSION = 5            # Minimum commission per transaction (CNY)
+DAYS_PER_YEAR = 365           # Day count for APR conversions
+
+# Golden ratio levels (based on Fibonacci ratios)
+GOLDEN_RATIOS = [
+    (0.191, 1.191, "Level 1"),
+    (0.236, 1.236, "Level 2"),
+    (0.382, 1.382, "Level 3"),
+    (0.500, 1.500, "Level 4"),
+    (0.618, 1.618, "Level 5"),
+    (0.764, 1.764, "Level 6"),
+    (0.809, 1.809, "Level 7"),
+]
+
+# The same table split into columns, precomputed for the level functions
+DOWN_RATIOS = tuple(down_ratio for down_ratio, _, _ in GOLDEN_RATIOS)
+UP_RATIOS = tuple(up_ratio for _, up_ratio, _ in GOLDEN_RATIOS)
+LEVEL_NAMES = tuple(level_name for _, _, level_name in GOLDEN_RATIOS)
+
+_ratio_arrays = None
+
+
+# =============================================================================
+# SCALAR / ARRAY HELPERS
+# =============================================================================
+
+def _np():
+    """Import NumPy on first use of an array input."""
+    import numpy
+    return numpy
+
+
+def _coerce(*values):
+    """Turn list and tuple arguments into float arrays; leave everything else alone."""
+    for value in values:
+        if isinstance(value, (list, tuple)):
+            break
+    else:
+        return values  # scalar fast path: no per-call allocation
+
+    np = _np()
+    return tuple(np.asarray(value, dtype=float) if isinstance(value, (list, tuple))
+                 else value for value in values)
+
+
+def _is_array(value):
+    return hasattr(value, "ndim")
+
+
+def _maximum(a, b):
+    """Element-wise max for arrays, builtin max for scalars."""
+    if _is_array(a) or _is_array(b):
+        return _np().maximum(a, b)
+    return max(a, b)
+
+
+def golden_ratio_arrays():
+    """Return (down_ratios, up_ratios) as NumPy arrays, built once."""
+    global _ratio_arrays
+    if _ratio_arrays is None:
+        np = _np()
+        _ratio_arrays = (np.array(DOWN_RATIOS), np.array(UP_RATIOS))
+    return _ratio_arrays
+
+
+# =============================================================================
+# COMMISSION FUNCTIONS
+# =============================================================================
+
+def gross_profit(sell_price, buy_price, share_volume):
+    """Gross profit from a stock trade."""
+    sell_price, buy_price, share_volume = _coerce(sell_price, buy_price, share_volume)
+    return sell_price * share_volume - buy_price * share_volume
+
+
+def commission(price, share_volume, commission_rate=COMMISSION_RATE,
+               min_commission=MIN_COMMISSION):
+    """Brokerage commission with minimum threshold."""
+    price, share_volume, commission_rate, min_commission = _coerce(
+        price, share_volume, commission_rate, min_commission)
+    return _maximum(price * share_volume * commission_rate, min_commission)
+
+
+def stamp_duty(sell_price, share_volume, stamp_duty_rate=STAMP_DUTY_RATE):
+    """Stamp duty (only applied on sell transactions)."""
+    sell_price, share_volume, stamp_duty_rate = _coerce(sell_price, share_volume, stamp_duty_rate)
+    return sell_price * share_volume * stamp_duty_rate
+
+
+def transfer_fee(price, share_volume, transfer_fee_rate=TRANSFER_FEE_RATE):
+    """Transfer fee for a transaction."""
+    price, share_volume, transfer_fee_rate = _coerce(price, share_volume, transfer_fee_rate)
+    return price * share_volume * transfer_fee_rate
+
+
+def trading_costs(buy_price, sell_price, share_volume,
+                  commission_rate_buy=COMMISSION_RATE, commission_rate_sell=COMMISSION_RATE,
+                  transfer_fee_rate=TRANSFER_FEE_RATE, stamp_duty_rate=STAMP_DUTY_RATE,
+                  min_commission=MIN_COMMISSION):
+    """
+    All trading costs for a round-trip trade.
+    Returns a dictionary with detailed breakdown.
+    """
+    commission_buy = commission(buy_price, share_volume, commission_rate_buy, min_commission)
+    transfer_fee_buy = transfer_fee(buy_price, share_volume, transfer_fee_rate)
+    cost_buy = commission_buy + transfer_fee_buy
+
+    commission_sell = commission(sell_price, share_volume, commission_rate_sell, min_commission)
+    transfer_fee_sell = transfer_fee(sell_price, share_volume, transfer_fee_rate)
+    duty = stamp_duty(sell_price, share_volume, stamp_duty_rate)
+    cost_sell = commission_sell + transfer_fee_sell + duty
+
+    return {
+        "commission_buy": commission_buy,
+        "commission_sell": commission_sell,
+        "transfer_fee_buy": transfer_fee_buy,
+        "transfer_fee_sell": transfer_fee_sell,
+        "stamp_duty": duty,
+        "cost_buy": cost_buy,
+        "cost_sell": cost_sell,
+        "total_cost": cost_buy + cost_sell,
+    }
+
+
+# =============================================================================
+# GOLDEN RATIO FUNCTIONS
+# =============================================================================
+
+def golden_ratio_level(base_price, multiplier):
+    """Price level from a base price and a golden ratio multiplier."""
+    base_price, multiplier = _coerce(base_price, multiplier)
+    return base_price * multiplier
+
+
+def golden_ratio_single(base_price):
+    """
+    Support and resistance levels from a single base price.
+
+    Returns (supports, resistances), one entry per GOLDEN_RATIOS level:
+    tuples for a scalar base price, arrays with a trailing level axis for
+    array input.
+    """
+    (base_price,) = _coerce(base_price)
+    if _is_array(base_price):
+        down_ratios, up_ratios = golden_ratio_arrays()
+        base_price = base_price[..., None]
+        return base_price * down_ratios, base_price * up_ratios
+    return (tuple(base_price * ratio for ratio in DOWN_RATIOS),
+            tuple(base_price * ratio for ratio in UP_RATIOS))
+
+
+def support_resistance(high_point, low_point, ratio):
+    """
+    Support and resistance for one golden ratio from a high/low range.
+    Returns (support_level, resistance_level).
+    """
+    high_point, low_point, ratio = _coerce(high_point, low_point, ratio)
+    price_range = high_point - low_point
+    support_level = high_point - price_range * ratio
+    return support_level, support_level + price_range * (1 + ratio)
+
+
+def golden_ratio_dual(high_point, low_point):
+    """
+    Support and resistance levels from a high/low range, for every level.
+
+    Returns (supports, resistances) shaped like golden_ratio_single().
+    """
+    high_point, low_point = _coerce(high_point, low_point)
+    if _is_array(high_point) or _is_array(low_point):
+        np = _np()
+        down_ratios, up_ratios = golden_ratio_arrays()
+        high_point = np.asarray(high_point, dtype=float)[..., None]
+        price_range = high_point - np.asarray(low_point, dtype=float)[..., None]
+        supports = high_point - price_range * down_ratios
+        return supports, supports + price_range * up_ratios
+
+    price_range = high_point - low_point
+    supports = tuple(high_point - price_range * ratio for ratio in DOWN_RATIOS)
+    return supports, tuple(support + price_range * ratio
+                           for support, ratio in zip(supports, UP_RATIOS))
+
+
+# =============================================================================
+# APR (ANNUAL PERCENTAGE RATE) FUNCTIONS
+# =============================================================================
+
+def apr_from_profit(principal, days, profit):
+    """APR (%) = profit / days * 365 / principal * 100"""
+    principal, days, profit = _coerce(principal, days, profit)
+    return (profit / days * DAYS_PER_YEAR / principal) * 100
+
+
+def profit_from_apr(principal, days, apr):
+    """profit = principal * apr / 100 / 365 * days"""
+    principal, days, apr = _coerce(principal, days, apr)
+    return principal * apr / 100 / DAYS_PER_YEAR * days
+
+
+def profit_from_annual_rate(principal, days, annual_rate):
+    """
+    profit = principal * annual_rate / 365 * days / 100
+
+    Same quantity as profit_from_apr(), in the evaluation order
+    PY3_RichTreasure.py has always printed; the two can differ in the
+    last bit.
+    """
+    principal, days, annual_rate = _coerce(principal, days, annual_rate)
+    return principal * annual_rate / DAYS_PER_YEAR * days / 100
+
+
+def daily_income(principal, apr):
+    """daily_income = principal * apr / 100 / 365"""
+    principal, apr = _coerce(principal, apr)
+    return principal * apr / 100 / DAYS_PER_YEAR
+
+
+def apr_from_daily_income(principal, income):
+    """APR (%) = daily_income * 365 / principal * 100"""
+    principal, income = _coerce(principal, income)
+    return (income * DAYS_PER_YEAR / principal) * 100
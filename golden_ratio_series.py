@@ -0,0 +1,148 @@
+"""
+Golden Ratio Series
+Rolling golden-ratio support/resistance levels over a full OHLC price series.
+
+For every bar, the high and low of the last N bars are fed into the same
+formula as calculate_golden_ratio_dual(), producing one support and one
+resistance column per GOLDEN_RATIOS level. Rolling highs and lows are kept
+with monotonic deques, so the whole series costs O(n) regardless of the
+window size, and bars are streamed so files larger than memory work.
+
+Usage:
+  python golden_ratio_series.py prices.csv --window 20 --output levels.csv
+
+The input CSV needs a header with at least "high" and "low" columns; a
+"date" column, if present, is copied to the output.
+"""
+
+import argparse
+import csv
+import sys
+from collections import deque
+
+import financial_kernel as kernel
+from financial_kernel import GOLDEN_RATIOS
+
+LEVEL_COLUMNS = [
+    f"{side}_{level_name.lower().replace(' ', '_')}"
+    for _, _, level_name in GOLDEN_RATIOS
+    for side in ("support", "resistance")
+]
+
+
+# =============================================================================
+# ROLLING WINDOW FUNCTIONS
+# =============================================================================
+
+def rolling_high_low(bars, window):
+    """
+    Yield (rolling_high, rolling_low) for each (high, low) bar.
+
+    Each deque holds indices of bars that can still become the window
+    maximum (or minimum), in monotonic order, so every bar is pushed and
+    popped at most once. Until `window` bars have been seen, the levels
+    cover all bars so far.
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1")
+
+    highs = deque()  # (index, high), highs strictly decreasing
+    lows = deque()   # (index, low), lows strictly increasing
+
+    for index, (high, low) in enumerate(bars):
+        while highs and highs[-1][1] <= high:
+            highs.pop()
+        highs.append((index, high))
+        if highs[0][0] <= index - window:
+            highs.popleft()
+
+        while lows and lows[-1][1] >= low:
+            lows.pop()
+        lows.append((index, low))
+        if lows[0][0] <= index - window:
+            lows.popleft()
+
+        yield highs[0][1], lows[0][1]
+
+
+def golden_ratio_levels(high_point, low_point):
+    """
+    Return the flat support/resistance levels for one high/low pair.
+
+    Same math and rounding as calculate_golden_ratio_dual(), ordered as
+    LEVEL_COLUMNS.
+    """
+    supports, resistances = kernel.golden_ratio_dual(high_point, low_point)
+    levels = []
+    for support, resistance in zip(supports, resistances):
+        levels.append(round(support, 2))
+        levels.append(round(resistance, 2))
+    return levels
+
+
+def golden_ratio_series(bars, window):
+    """Yield (rolling_high, rolling_low, levels) for each (high, low) bar."""
+    for high_point, low_point in rolling_high_low(bars, window):
+        yield high_point, low_point, golden_ratio_levels(high_point, low_point)
+
+
+# =============================================================================
+# FILE STREAMING
+# =============================================================================
+
+def stream_golden_ratio_csv(input_file, output_file, window):
+    """
+    Stream an OHLC CSV from `input_file` to a levels CSV in `output_file`.
+
+    Only the current window is kept in memory. Returns the number of bars
+    written.
+    """
+    reader = csv.DictReader(input_file)
+    has_date = "date" in (reader.fieldnames or [])
+
+    dates = deque()  # dates of bars read but not yet written (at most one)
+
+    def bars():
+        for row in reader:
+            if has_date:
+                dates.append(row["date"])
+            yield float(row["high"]), float(row["low"])
+
+    writer = csv.writer(output_file)
+    writer.writerow((["date"] if has_date else []) + ["rolling_high", "rolling_low"]
+                    + LEVEL_COLUMNS)
+
+    count = 0
+    for high_point, low_point, levels in golden_ratio_series(bars(), window):
+        prefix = [dates.popleft()] if has_date else []
+        writer.writerow(prefix + [high_point, low_point] + levels)
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rolling golden-ratio support/resistance levels for an OHLC CSV.")
+    parser.add_argument("input", help="OHLC CSV file with high and low columns ('-' for stdin).")
+    parser.add_argument("--window", "-w", type=int, default=20,
+                        help="Number of bars in the rolling high/low window (default 20).")
+    parser.add_argument("--output", "-o", default="-",
+                        help="Output CSV file (default stdout).")
+    args = parser.parse_args()
+
+    input_file = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    output_file = sys.stdout if args.output == "-" else open(args.output, "w", newline="",
+                                                            encoding="utf-8")
+    try:
+        count = stream_golden_ratio_csv(input_file, output_file, args.window)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+    print(f"Wrote {count} bars", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
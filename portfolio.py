@@ -0,0 +1,191 @@
+"""
+Portfolio Lot Matching
+FIFO/LIFO lot matching over a time-ordered stream of buy/sell fills, with
+per-lot fee allocation and incremental realized P&L.
+
+Each symbol keeps its open lots in a deque: buys append to the right,
+FIFO sells consume from the left and LIFO sells from the right, so every
+fill costs O(1) amortized (each lot is opened once and closed once).
+
+Fees per fill come from the same components as calculate_trading_costs:
+commission (with the minimum), transfer fee, and stamp duty on sells. Buy
+fees stay attached to their lot and are released pro rata as the lot is
+sold; sell fees are split pro rata across the lots a sell closes.
+
+Usage:
+  python portfolio.py fills.csv --method lifo
+
+The fills CSV needs the columns symbol, side (buy/sell), price, shares,
+already sorted by time.
+"""
+
+import argparse
+import csv
+from collections import deque, namedtuple
+
+from financial_calculator import (
+    calculate_commission,
+    calculate_stamp_duty,
+    calculate_transfer_fee,
+)
+
+MATCH_METHODS = ("fifo", "lifo")
+
+MatchedLot = namedtuple(
+    "MatchedLot",
+    ["symbol", "shares", "buy_price", "sell_price",
+     "buy_fee", "sell_fee", "gross_profit", "net_profit"],
+)
+
+
+# =============================================================================
+# LOT LEDGER
+# =============================================================================
+
+class LotLedger:
+    """Open lots and realized totals for a single symbol."""
+
+    __slots__ = ("symbol", "method", "lots", "open_shares",
+                 "realized_gross", "realized_fees")
+
+    def __init__(self, symbol, method="fifo"):
+        if method not in MATCH_METHODS:
+            raise ValueError(f"method must be one of {MATCH_METHODS}, got {method!r}")
+        self.symbol = symbol
+        self.method = method
+        self.lots = deque()  # [shares, price, unallocated buy fee]
+        self.open_shares = 0
+        self.realized_gross = 0.0
+        self.realized_fees = 0.0
+
+    @property
+    def realized_net(self):
+        return self.realized_gross - self.realized_fees
+
+    def buy(self, price, shares):
+        """Open a new lot; its buy fees are held until the lot is sold."""
+        if shares <= 0:
+            raise ValueError(f"{self.symbol}: cannot buy {shares} shares")
+        fee = calculate_commission(price, shares) + calculate_transfer_fee(price, shares)
+        self.lots.append([shares, price, fee])
+        self.open_shares += shares
+        return []
+
+    def sell(self, price, shares):
+        """Close `shares` against open lots and return the MatchedLot records."""
+        if shares <= 0:
+            raise ValueError(f"{self.symbol}: cannot sell {shares} shares")
+        if shares > self.open_shares:
+            raise ValueError(f"{self.symbol}: cannot sell {shares} shares, "
+                             f"only {self.open_shares} open")
+
+        sell_fee = (calculate_commission(price, shares)
+                    + calculate_transfer_fee(price, shares)
+                    + calculate_stamp_duty(price, shares))
+        take_lot = self.lots.popleft if self.method == "fifo" else self.lots.pop
+        lot_index = 0 if self.method == "fifo" else -1
+
+        matches = []
+        remaining = shares
+        while remaining > 0:
+            lot = self.lots[lot_index]
+            lot_shares, buy_price, lot_fee = lot
+            matched = min(lot_shares, remaining)
+
+            buy_fee = lot_fee * matched / lot_shares
+            matched_sell_fee = sell_fee * matched / shares
+            if matched == lot_shares:
+                take_lot()
+            else:
+                lot[0] = lot_shares - matched
+                lot[2] = lot_fee - buy_fee
+
+            gross_profit = (price - buy_price) * matched
+            net_profit = gross_profit - buy_fee - matched_sell_fee
+            matches.append(MatchedLot(self.symbol, matched, buy_price, price,
+                                      buy_fee, matched_sell_fee, gross_profit, net_profit))
+
+            self.realized_gross += gross_profit
+            self.realized_fees += buy_fee + matched_sell_fee
+            remaining -= matched
+
+        self.open_shares -= shares
+        return matches
+
+
+# =============================================================================
+# PORTFOLIO
+# =============================================================================
+
+class Portfolio:
+    """
+    Lot ledgers for many symbols plus running realized totals.
+
+    process() handles one fill and returns the lots it closed, so realized
+    P&L can be reported as the stream is consumed.
+    """
+
+    def __init__(self, method="fifo"):
+        if method not in MATCH_METHODS:
+            raise ValueError(f"method must be one of {MATCH_METHODS}, got {method!r}")
+        self.method = method
+        self.ledgers = {}
+        self.realized_gross = 0.0
+        self.realized_fees = 0.0
+
+    @property
+    def realized_net(self):
+        return self.realized_gross - self.realized_fees
+
+    def process(self, symbol, side, price, shares):
+        """Apply one fill and return the list of MatchedLot records it closed."""
+        if side not in ("buy", "sell"):
+            raise ValueError(f"side must be 'buy' or 'sell', got {side!r}")
+
+        ledger = self.ledgers.get(symbol)
+        if ledger is None:
+            ledger = self.ledgers[symbol] = LotLedger(symbol, self.method)
+
+        if side == "buy":
+            return ledger.buy(price, shares)
+
+        matches = ledger.sell(price, shares)
+        for match in matches:
+            self.realized_gross += match.gross_profit
+            self.realized_fees += match.buy_fee + match.sell_fee
+        return matches
+
+    def process_stream(self, fills):
+        """Apply (symbol, side, price, shares) fills, yielding each closed lot."""
+        for symbol, side, price, shares in fills:
+            yield from self.process(symbol, side, price, shares)
+
+
+def read_fills(path):
+    """Stream (symbol, side, price, shares) tuples from a fills CSV."""
+    with open(path, newline="", encoding="utf-8") as fh:
+        for row in csv.DictReader(fh):
+            yield row["symbol"], row["side"].lower(), float(row["price"]), float(row["shares"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Realized P&L from a stream of fills.")
+    parser.add_argument("fills", help="CSV with symbol, side, price, shares columns.")
+    parser.add_argument("--method", choices=MATCH_METHODS, default="fifo",
+                        help="Lot matching method (default fifo).")
+    args = parser.parse_args()
+
+    portfolio = Portfolio(args.method)
+    matched_lots = 0
+    for _ in portfolio.process_stream(read_fills(args.fills)):
+        matched_lots += 1
+
+    print(f"Symbols: {len(portfolio.ledgers)}")
+    print(f"Matched Lots: {matched_lots}")
+    print(f"Realized Gross Profit: {portfolio.realized_gross:.2f} CNY")
+    print(f"Allocated Fees: {portfolio.realized_fees:.2f} CNY")
+    print(f"Realized Net Profit: {portfolio.realized_net:.2f} CNY")
+
+
+if __name__ == "__main__":
+    main()
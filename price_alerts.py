@@ -0,0 +1,243 @@
+"""
+Golden Ratio Price Alerts
+Alerts when a live or replayed tick stream crosses the golden-ratio levels
+printed by PY3_RichTreasure's branch 2 (single base point) and branch 3
+(dual base points).
+
+Each symbol keeps its fourteen levels in a sorted list together with the
+bisect position of the last price. A tick costs one dict lookup and one
+bisect; only when the position changes were levels crossed, and those
+are exactly the levels between the old and new positions.
+
+Usage:
+  python price_alerts.py levels.csv ticks.csv
+  python price_alerts.py levels.csv --socket 127.0.0.1:9000
+
+levels.csv rows are "symbol,base" for single-base levels or
+"symbol,high,low" for dual-base levels. Tick lines end in "symbol,price"
+(a leading timestamp field is allowed).
+"""
+
+import argparse
+import csv
+import socket
+import time
+from bisect import bisect_right
+
+from PY3_RichTreasure import (
+    CHAKRA_LEVELS,
+    calculate_golden_ratio_level,
+    calculate_support_resistance,
+)
+
+
+# ==================== LEVEL SETS ====================
+
+def single_base_levels(base_price):
+    """Branch 2 levels as (price, label) pairs."""
+    levels = []
+    for i, (_, ratio_down, ratio_up) in enumerate(CHAKRA_LEVELS, 1):
+        levels.append((calculate_golden_ratio_level(base_price, ratio_up),
+                       f"Level +{i} (Base x {ratio_up:.3f})"))
+        levels.append((calculate_golden_ratio_level(base_price, ratio_down),
+                       f"Level -{8 - i} (Base x {ratio_down:.3f})"))
+    return levels
+
+
+def dual_base_levels(high_point, low_point):
+    """Branch 3 levels as (price, label) pairs."""
+    levels = []
+    for i, (chakra_name, ratio_down, _) in enumerate(CHAKRA_LEVELS, 1):
+        support, resistance = calculate_support_resistance(high_point, low_point, ratio_down)
+        levels.append((support, f"Level {i} ({chakra_name}) Downtrend Support"))
+        levels.append((resistance, f"Level {i} ({chakra_name}) Uptrend Resistance"))
+    return levels
+
+
+# ==================== ALERT ENGINE ====================
+
+class AlertEngine:
+    """
+    Sorted per-symbol level index checked against incoming ticks.
+
+    State per symbol is [prices, labels, position], where prices is sorted
+    and position is bisect_right(prices, last_price), or None before the
+    first tick.
+    """
+
+    def __init__(self):
+        self.symbols = {}
+
+    def set_levels(self, symbol, levels):
+        """
+        Replace a symbol's levels with (price, label) pairs.
+
+        The position is reset, so the tick after a level change only
+        re-anchors the symbol and never raises alerts against old levels.
+        """
+        levels = sorted(levels)
+        self.symbols[symbol] = [
+            [price for price, _ in levels],
+            [label for _, label in levels],
+            None,
+        ]
+
+    def set_single_base(self, symbol, base_price):
+        """Recompute a symbol's levels from one base price (branch 2)."""
+        self.set_levels(symbol, single_base_levels(base_price))
+
+    def set_dual_base(self, symbol, high_point, low_point):
+        """Recompute a symbol's levels from a high/low pair (branch 3)."""
+        self.set_levels(symbol, dual_base_levels(high_point, low_point))
+
+    def on_tick(self, symbol, price):
+        """
+        Process one tick and return a list of (symbol, label, level, direction)
+        alerts, where direction is "up" or "down".
+        """
+        state = self.symbols.get(symbol)
+        if state is None:
+            return []
+
+        prices, labels, previous = state
+        position = bisect_right(prices, price)
+        state[2] = position
+        if previous is None or position == previous:
+            return []
+
+        if position > previous:
+            return [(symbol, labels[i], prices[i], "up") for i in range(previous, position)]
+        return [(symbol, labels[i], prices[i], "down")
+                for i in range(previous - 1, position - 1, -1)]
+
+    def replay(self, ticks, on_alert=None):
+        """
+        Run (symbol, price) ticks through the index; returns (ticks, alerts).
+
+        Same logic as on_tick() inlined into one loop with local names, since
+        replay throughput is dominated by per-tick interpreter overhead.
+        """
+        symbols = self.symbols
+        get = symbols.get
+        bisect = bisect_right
+        tick_count = alert_count = 0
+
+        for symbol, price in ticks:
+            tick_count += 1
+            state = get(symbol)
+            if state is None:
+                continue
+            prices = state[0]
+            position = bisect(prices, price)
+            previous = state[2]
+            if position == previous:
+                continue
+            state[2] = position
+            if previous is None:
+                continue
+
+            if position > previous:
+                crossed = range(previous, position)
+                direction = "up"
+            else:
+                crossed = range(previous - 1, position - 1, -1)
+                direction = "down"
+            alert_count += len(crossed)
+            if on_alert is not None:
+                labels = state[1]
+                for i in crossed:
+                    on_alert(symbol, labels[i], prices[i], direction)
+
+        return tick_count, alert_count
+
+
+# ==================== TICK SOURCES ====================
+
+def parse_tick(line):
+    """
+    Parse one "symbol,price" or "timestamp,symbol,price" line.
+
+    Returns (symbol, price), or None for headers and malformed lines.
+    """
+    fields = line.strip().split(",")
+    if len(fields) < 2:
+        return None
+    try:
+        return fields[-2], float(fields[-1])
+    except ValueError:
+        return None
+
+
+def parse_tick_lines(lines):
+    """Yield (symbol, price) for every valid tick line."""
+    for line in lines:
+        tick = parse_tick(line)
+        if tick is not None:
+            yield tick
+
+
+def read_tick_file(path):
+    """Stream ticks from a local file."""
+    with open(path, encoding="utf-8") as fh:
+        yield from parse_tick_lines(fh)
+
+
+def read_tick_socket(host, port):
+    """Stream ticks from a TCP socket until the sender closes it."""
+    with socket.create_connection((host, port)) as sock:
+        with sock.makefile("r", encoding="utf-8") as fh:
+            yield from parse_tick_lines(fh)
+
+
+def load_levels(engine, path):
+    """Load "symbol,base" or "symbol,high,low" rows into the engine."""
+    with open(path, newline="", encoding="utf-8") as fh:
+        for row in csv.reader(fh):
+            try:
+                values = [float(value) for value in row[1:]]
+            except ValueError:
+                continue  # header
+            if len(values) == 1:
+                engine.set_single_base(row[0], values[0])
+            elif len(values) == 2:
+                engine.set_dual_base(row[0], values[0], values[1])
+
+
+# ==================== MAIN PROGRAM ====================
+
+def main():
+    parser = argparse.ArgumentParser(description="Golden ratio level crossing alerts.")
+    parser.add_argument("levels", help="CSV of symbol,base or symbol,high,low rows.")
+    parser.add_argument("ticks", nargs="?", help="Tick file to replay.")
+    parser.add_argument("--socket", metavar="HOST:PORT", help="Read ticks from a TCP socket.")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="Only print the summary, not each alert.")
+    args = parser.parse_args()
+
+    if bool(args.ticks) == bool(args.socket):
+        parser.error("give either a tick file or --socket")
+
+    engine = AlertEngine()
+    load_levels(engine, args.levels)
+
+    if args.socket:
+        host, port = args.socket.rsplit(":", 1)
+        ticks = read_tick_socket(host, int(port))
+    else:
+        ticks = read_tick_file(args.ticks)
+
+    def print_alert(symbol, label, level, direction):
+        print(f"{symbol}: crossed {direction} {label} at {level:.2f}")
+
+    start = time.perf_counter()
+    tick_count, alert_count = engine.replay(ticks, None if args.quiet else print_alert)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nSymbols: {len(engine.symbols)}")
+    print(f"Ticks: {tick_count}  Alerts: {alert_count}")
+    if elapsed > 0:
+        print(f"Throughput: {tick_count / elapsed:,.0f} ticks/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Net Profit Sensitivity Grid
+Net profit and fee-to-profit ratio over a dense 3-D grid of buy prices,
+sell prices and share volumes, the batch counterpart of
+handle_commission_calculation().
+
+The grid is evaluated with broadcasting, a block of buy prices at a time
+(and a block of sell prices too when a single buy price's row is too
+large), so peak memory stays within a budget however large the grid is. Results
+stream into two float32 .npy files (memory-mapped, shape
+buy x sell x volume) and a per-volume summary CSV.
+
+The fee-to-profit ratio is total trading cost divided by gross profit,
+and is NaN where gross profit is zero or negative.
+
+Usage:
+  python sensitivity_grid.py -o results/grid --buy 5 15 201 --sell 5 15 201 --volume 100 100000 1000
+"""
+
+import argparse
+import csv
+
+import numpy as np
+
+from financial_calculator import calculate_trading_costs_batch
+
+# Rough count of full-size float64 temporaries alive while one block is
+# priced (prices, values, fee components, results)
+TEMPORARIES_PER_CELL = 16
+
+
+# =============================================================================
+# GRID EVALUATION
+# =============================================================================
+
+def evaluate_block(buy_prices, sell_prices, share_volumes):
+    """
+    Evaluate one block of the grid by broadcasting.
+
+    Returns (net_profit, fee_ratio) arrays of shape
+    (len(buy_prices), len(sell_prices), len(share_volumes)).
+    """
+    buy = np.asarray(buy_prices, dtype=float)[:, None, None]
+    sell = np.asarray(sell_prices, dtype=float)[None, :, None]
+    volume = np.asarray(share_volumes, dtype=float)[None, None, :]
+
+    gross_profit = (sell - buy) * volume
+    total_cost = calculate_trading_costs_batch(buy, sell, volume)["total_cost"]
+    net_profit = gross_profit - total_cost
+
+    fee_ratio = np.full(net_profit.shape, np.nan)
+    np.divide(total_cost, gross_profit, out=fee_ratio, where=gross_profit > 0)
+    return net_profit, fee_ratio
+
+
+def block_shape(sell_count, volume_count, memory_budget):
+    """
+    (buy prices, sell prices) per block that keep a block within
+    memory_budget bytes.
+
+    Whole sell rows are used while one buy price's row fits the budget;
+    beyond that the sell axis is split too. Raises ValueError when not
+    even a single buy x sell cell (one value per share volume) fits.
+    """
+    cell_bytes = volume_count * 8 * TEMPORARIES_PER_CELL
+    if cell_bytes > memory_budget:
+        raise ValueError(f"memory budget of {memory_budget} bytes is below the "
+                         f"{cell_bytes} bytes needed for one buy/sell pair")
+    row_bytes = sell_count * cell_bytes
+    if row_bytes <= memory_budget:
+        return memory_budget // row_bytes, sell_count
+    return 1, memory_budget // cell_bytes
+
+
+def evaluate_grid(buy_prices, sell_prices, share_volumes, output_prefix,
+                  memory_budget=256 * 1024 ** 2):
+    """
+    Evaluate the full grid block by block and write the result files.
+
+    Writes <prefix>_net_profit.npy, <prefix>_fee_ratio.npy and
+    <prefix>_summary.csv, and returns the list of summary rows.
+    """
+    buy_prices = np.asarray(buy_prices, dtype=float)
+    sell_prices = np.asarray(sell_prices, dtype=float)
+    share_volumes = np.asarray(share_volumes, dtype=float)
+    shape = (len(buy_prices), len(sell_prices), len(share_volumes))
+    for name, size in zip(("buy prices", "sell prices", "share volumes"), shape):
+        if size == 0:
+            raise ValueError(f"the grid needs at least one value for {name}")
+    rows, columns = block_shape(shape[1], shape[2], memory_budget)
+
+    net_file = np.lib.format.open_memmap(
+        f"{output_prefix}_net_profit.npy", mode="w+", dtype=np.float32, shape=shape)
+    ratio_file = np.lib.format.open_memmap(
+        f"{output_prefix}_fee_ratio.npy", mode="w+", dtype=np.float32, shape=shape)
+
+    # Per-volume aggregates, accumulated across blocks
+    net_min = np.full(shape[2], np.inf)
+    net_max = np.full(shape[2], -np.inf)
+    net_sum = np.zeros(shape[2])
+    profitable = np.zeros(shape[2], dtype=np.int64)
+    ratio_sum = np.zeros(shape[2])
+    ratio_count = np.zeros(shape[2], dtype=np.int64)
+
+    for start in range(0, shape[0], rows):
+        stop = min(start + rows, shape[0])
+        for sell_start in range(0, shape[1], columns):
+            sell_stop = min(sell_start + columns, shape[1])
+            net_profit, fee_ratio = evaluate_block(
+                buy_prices[start:stop], sell_prices[sell_start:sell_stop], share_volumes)
+            net_file[start:stop, sell_start:sell_stop] = net_profit
+            ratio_file[start:stop, sell_start:sell_stop] = fee_ratio
+
+            net_min = np.minimum(net_min, net_profit.min(axis=(0, 1)))
+            net_max = np.maximum(net_max, net_profit.max(axis=(0, 1)))
+            net_sum += net_profit.sum(axis=(0, 1))
+            profitable += (net_profit > 0).sum(axis=(0, 1))
+            ratio_sum += np.nansum(fee_ratio, axis=(0, 1))
+            ratio_count += (~np.isnan(fee_ratio)).sum(axis=(0, 1))
+
+    net_file.flush()
+    ratio_file.flush()
+    del net_file, ratio_file
+
+    cells = shape[0] * shape[1]
+    summary = []
+    for i, volume in enumerate(share_volumes):
+        summary.append({
+            "share_volume": volume,
+            "net_profit_min": net_min[i],
+            "net_profit_mean": net_sum[i] / cells,
+            "net_profit_max": net_max[i],
+            "profitable_fraction": profitable[i] / cells,
+            "fee_ratio_mean": ratio_sum[i] / ratio_count[i] if ratio_count[i] else float("nan"),
+        })
+
+    with open(f"{output_prefix}_summary.csv", "w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(summary[0]))
+        writer.writeheader()
+        writer.writerows(summary)
+
+    return summary
+
+
+# =============================================================================
+# MAIN PROGRAM
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Net profit sensitivity grid.")
+    parser.add_argument("--buy", type=float, nargs=3, metavar=("MIN", "MAX", "STEPS"),
+                        default=[5.0, 15.0, 101], help="Buy price range.")
+    parser.add_argument("--sell", type=float, nargs=3, metavar=("MIN", "MAX", "STEPS"),
+                        default=[5.0, 15.0, 101], help="Sell price range.")
+    parser.add_argument("--volume", type=float, nargs=3, metavar=("MIN", "MAX", "STEPS"),
+                        default=[100, 100000, 1000], help="Share volume range.")
+    parser.add_argument("--memory-mb", type=int, default=256,
+                        help="Memory budget per block in MB (default 256).")
+    parser.add_argument("--output", "-o", required=True,
+                        help="Output file prefix, e.g. results/grid (the grid files can be large).")
+    args = parser.parse_args()
+
+    buy_prices = np.linspace(args.buy[0], args.buy[1], int(args.buy[2]))
+    sell_prices = np.linspace(args.sell[0], args.sell[1], int(args.sell[2]))
+    share_volumes = np.linspace(args.volume[0], args.volume[1], int(args.volume[2]))
+
+    try:
+        summary = evaluate_grid(buy_prices, sell_prices, share_volumes, args.output,
+                                memory_budget=args.memory_mb * 1024 ** 2)
+    except ValueError as err:
+        parser.error(str(err))
+    print(f"Grid: {len(buy_prices)} x {len(sell_prices)} x {len(share_volumes)}")
+    print(f"Wrote {args.output}_net_profit.npy, {args.output}_fee_ratio.npy, "
+          f"{args.output}_summary.csv ({len(summary)} rows)")
+
+
+if __name__ == "__main__":
+    main()
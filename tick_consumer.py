@@ -0,0 +1,205 @@
+"""
+Tick Consumer
+Asyncio market-feed consumer with incrementally updated running P&L.
+
+Open positions are loaded once; ticks then arrive from a local TCP socket
+or a tailed file. Each tick touches only its own symbol: the position's
+mark-to-market gross profit and projected round-trip fees (via
+calculate_trading_costs, as if sold at the tick price) are recomputed, and
+the portfolio totals are adjusted by the difference. Snapshots of the
+totals are published at a fixed interval, so their cost never depends on
+the number of positions.
+
+Usage:
+  python tick_consumer.py positions.csv --socket 127.0.0.1:9000
+  python tick_consumer.py positions.csv --tail ticks.log --interval 1
+
+positions.csv rows are "symbol,buy_price,shares". Tick lines use the same
+format as price_alerts.py ("symbol,price", optional leading timestamp).
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import time
+
+from financial_calculator import calculate_trading_costs
+from price_alerts import parse_tick
+
+
+class Position:
+    """Compact per-symbol state: entry, plus the last marked gross and fees."""
+
+    __slots__ = ("buy_price", "shares", "gross_profit", "projected_fees")
+
+    def __init__(self, buy_price, shares):
+        self.buy_price = buy_price
+        self.shares = shares
+        self.gross_profit = 0.0
+        self.projected_fees = 0.0
+
+
+class RunningPnL:
+    """Open positions and portfolio totals, updated one tick at a time."""
+
+    def __init__(self):
+        self.positions = {}
+        self.gross_profit = 0.0
+        self.projected_fees = 0.0
+        self.ticks = 0
+
+    def open_position(self, symbol, buy_price, shares):
+        """Add (or replace) a position, marked at its buy price until the first tick."""
+        self.close_position(symbol)
+        position = Position(buy_price, shares)
+        self.positions[symbol] = position
+        self._mark(position, buy_price)
+
+    def close_position(self, symbol):
+        """Remove a position and its contribution to the totals."""
+        position = self.positions.pop(symbol, None)
+        if position is not None:
+            self.gross_profit -= position.gross_profit
+            self.projected_fees -= position.projected_fees
+
+    def on_tick(self, symbol, price):
+        """Re-mark one symbol; symbols without a position are ignored."""
+        self.ticks += 1
+        position = self.positions.get(symbol)
+        if position is not None:
+            self._mark(position, price)
+
+    def _mark(self, position, price):
+        gross_profit = (price - position.buy_price) * position.shares
+        fees = calculate_trading_costs(position.buy_price, price, position.shares)["total_cost"]
+        self.gross_profit += gross_profit - position.gross_profit
+        self.projected_fees += fees - position.projected_fees
+        position.gross_profit = gross_profit
+        position.projected_fees = fees
+
+    def snapshot(self):
+        """Return the current totals as a dictionary."""
+        return {
+            "time": time.time(),
+            "ticks": self.ticks,
+            "positions": len(self.positions),
+            "gross_profit": round(self.gross_profit, 2),
+            "projected_fees": round(self.projected_fees, 2),
+            "net_profit": round(self.gross_profit - self.projected_fees, 2),
+        }
+
+
+# ==================== TICK SOURCES ====================
+
+async def socket_lines(host, port):
+    """Yield lines from a TCP socket until the sender closes it."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            yield line.decode("utf-8", errors="replace")
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def tail_lines(path, poll_interval=0.1, from_start=False):
+    """Yield lines appended to a file, polling for new data like `tail -f`."""
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        if not from_start:
+            fh.seek(0, 2)
+        pending = ""
+        while True:
+            chunk = fh.readline()
+            if not chunk:
+                await asyncio.sleep(poll_interval)
+                continue
+            pending += chunk
+            if pending.endswith("\n"):
+                yield pending
+                pending = ""
+
+
+# ==================== CONSUMER ====================
+
+async def consume(pnl, lines, yield_every=1000):
+    """
+    Apply every tick line from an async line source to `pnl`.
+
+    Reading an already-buffered line never suspends, so the loop yields to
+    the event loop every `yield_every` lines to keep snapshots on time
+    under a sustained feed.
+    """
+    count = 0
+    async for line in lines:
+        tick = parse_tick(line)
+        if tick is not None:
+            pnl.on_tick(*tick)
+        count += 1
+        if count % yield_every == 0:
+            await asyncio.sleep(0)
+
+
+async def publish_snapshots(pnl, interval, output=sys.stdout):
+    """Write a JSON snapshot line every `interval` seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        output.write(json.dumps(pnl.snapshot()) + "\n")
+        output.flush()
+
+
+async def run(pnl, lines, interval):
+    """Consume ticks while publishing snapshots; publish a final one at the end."""
+    publisher = asyncio.create_task(publish_snapshots(pnl, interval))
+    try:
+        await consume(pnl, lines)
+    finally:
+        publisher.cancel()
+    print(json.dumps(pnl.snapshot()))
+
+
+def load_positions(pnl, path):
+    """Load "symbol,buy_price,shares" rows (a header row is skipped)."""
+    with open(path, newline="", encoding="utf-8") as fh:
+        for row in csv.reader(fh):
+            try:
+                pnl.open_position(row[0], float(row[1]), float(row[2]))
+            except (IndexError, ValueError):
+                continue
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Running P&L from a live tick feed.")
+    parser.add_argument("positions", help="CSV of symbol,buy_price,shares rows.")
+    parser.add_argument("--socket", metavar="HOST:PORT", help="Read ticks from a TCP socket.")
+    parser.add_argument("--tail", metavar="FILE", help="Follow ticks appended to a file.")
+    parser.add_argument("--from-start", action="store_true",
+                        help="With --tail, read the existing file contents first.")
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="Seconds between snapshots (default 1).")
+    args = parser.parse_args()
+
+    if bool(args.socket) == bool(args.tail):
+        parser.error("give exactly one of --socket or --tail")
+
+    pnl = RunningPnL()
+    load_positions(pnl, args.positions)
+
+    if args.socket:
+        host, port = args.socket.rsplit(":", 1)
+        lines = socket_lines(host, int(port))
+    else:
+        lines = tail_lines(args.tail, from_start=args.from_start)
+
+    try:
+        asyncio.run(run(pnl, lines, args.interval))
+    except KeyboardInterrupt:
+        print(json.dumps(pnl.snapshot()))
+
+
+if __name__ == "__main__":
+    main()